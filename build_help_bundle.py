@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Probe Basic Help Bundle Builder
+Pre-serializes the JSON help files into a single pickle loaded at startup
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+# Import help_system directly to avoid the qtpyvcp dependency of the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'probe_basic'))
+
+from help_system import build_help_bundle
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Build the Probe Basic help data bundle"
+    )
+    
+    parser.add_argument(
+        '-d', '--help-data-dir',
+        type=Path,
+        help='Directory with the JSON help files (default: src/probe_basic/help_data)'
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        bundle_path = build_help_bundle(args.help_data_dir)
+    except Exception as e:
+        print(f"Error building help bundle: {e}")
+        return 1
+    
+    print(f"Help bundle written to {bundle_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,106 +2,170 @@
 """
 Phase 4 Probing & Tool Setting Wizards Demonstration
 Shows the key features and workflow of the new probing and toolsetter functionality
+
+Pauses between sections only when run from a terminal. Pass --fast or set
+PB_DEMO_NONINTERACTIVE=1 to run straight through.
 """
 
 import os
 import sys
 
+from phase4_macros import MACRO_DIR, macro_stats
+
+_OVERVIEW_LINES = (
+    "=" * 60,
+    "PHASE 4 - PROBING & TOOL SETTING WIZARDS",
+    "=" * 60,
+    "",
+    "IMPLEMENTATION COMPLETE ✅",
+    "",
+    "Key Features:",
+    "• Unified probing flows with PB-Touch visuals",
+    "• Safety checklists and dry-run preview",
+    "• Tool setter wizard with breakage detection",
+    "• Probe calibration with runout compensation",
+    "• WCS and tool table updates",
+    "• Complete NGC macro suite",
+    "",
+)
+
+_PROBING_WIZARDS_LINES = (
+    "PROBING WIZARDS WIDGET",
+    "-" * 30,
+    "",
+    "Available Probing Operations:",
+    "1. Edge Probing (X+, X-, Y+, Y-)",
+    "   • Single edge finding with direction selection",
+    "   • Automatic probe radius compensation",
+    "   • Optional WCS update",
+    "",
+    "2. Corner Probing (Inside/Outside)",
+    "   • Front-left, front-right, back-left, back-right",
+    "   • Two-touch sequence for accuracy",
+    "   • Corner position calculation",
+    "",
+    "3. Boss/Pocket Center Finding",
+    "   • 4-point probing sequence",
+    "   • Center calculation with size measurement",
+    "   • Automatic feature type detection",
+    "",
+    "4. Z Touch-off",
+    "   • Fast/slow probe sequence",
+    "   • Z offset application",
+    "   • WCS Z-zero setting",
+    "",
+    "Safety Features:",
+    "• Pre-flight safety checklist",
+    "• Visual probe positioning diagrams",
+    "• Dry-run preview mode",
+    "• Safe retract on abort/error",
+    "",
+)
+
+_TOOLSETTER_WIZARD_LINES = (
+    "TOOL SETTER WIZARD",
+    "-" * 20,
+    "",
+    "Guided Workflow:",
+    "1. Set tool setter position (G30)",
+    "2. Configure probe parameters",
+    "3. Load tool in spindle",
+    "4. Measure tool length",
+    "5. Save to tool table",
+    "",
+    "Key Features:",
+    "• Step-by-step progress indication",
+    "• Fast/slow probe sequence",
+    "• Automatic tool.tbl writing",
+    "• Tool breakage detection",
+    "• Measurement history tracking",
+    "• Safe height management",
+    "",
+    "Breakage Detection:",
+    "• Expected length comparison",
+    "• Configurable tolerance",
+    "• Automatic error detection",
+    "• Measurement validation",
+    "",
+)
+
+_PROBE_CALIBRATION_LINES = (
+    "PROBE CALIBRATION",
+    "-" * 18,
+    "",
+    "Calibration Process:",
+    "• Use known standard (ring or pin gauge)",
+    "• 4-point measurement sequence",
+    "• Effective probe diameter calculation",
+    "• Calibration offset determination",
+    "• Runout detection and compensation",
+    "",
+    "Accuracy Features:",
+    "• Probe tip diameter validation",
+    "• Feed rate dependency tracking",
+    "• Trigger distance compensation",
+    "• Multi-axis measurement comparison",
+    "",
+)
+
+_DIR_TREE_PHASE4 = """\
+├── src/widgets/probing_wizards/
+│   ├── __init__.py
+│   └── probing_wizards.py
+├── src/widgets/toolsetter_wizard/
+│   ├── __init__.py
+│   └── toolsetter_wizard.py
+└── wizards/probing/
+    ├── edges.ngc
+    ├── corners.ngc
+    ├── boss_pocket.ngc
+    ├── z_touchoff.ngc
+    ├── toolsetter.ngc
+    └── probe_calibration.ngc
+
+"""
+
+_ACCEPTANCE_LINES = (
+    "ACCEPTANCE CRITERIA VERIFICATION",
+    "-" * 35,
+    "",
+    "✅ Probing routines update active WCS (G54) in sim correctly",
+    "   → G10 L2 commands in all probing macros",
+    "   → Parameter-driven WCS selection",
+    "   → Position-only mode available",
+    "",
+    "✅ Toolsetter updates tool length; persisted in tool.tbl",
+    "   → G10 L1 command in toolsetter.ngc",
+    "   → Automatic tool table writing",
+    "   → Tool offset validation",
+    "",
+    "✅ Cancel/abort safely retracts and restores modes",
+    "   → Error handling in all macros",
+    "   → Safe retract sequences",
+    "   → Mode restoration on abort",
+    "",
+    "✅ Unified Probe Basic flows into PB-Touch visuals",
+    "   → Modern tabbed widget interface",
+    "   → Safety checklists and diagrams",
+    "   → Guided step-by-step workflows",
+    "",
+)
+
 def show_phase4_overview():
     """Display overview of Phase 4 implementation"""
-    print("=" * 60)
-    print("PHASE 4 - PROBING & TOOL SETTING WIZARDS")
-    print("=" * 60)
-    print()
-    print("IMPLEMENTATION COMPLETE ✅")
-    print()
-    print("Key Features:")
-    print("• Unified probing flows with PB-Touch visuals")
-    print("• Safety checklists and dry-run preview")
-    print("• Tool setter wizard with breakage detection")
-    print("• Probe calibration with runout compensation")
-    print("• WCS and tool table updates")
-    print("• Complete NGC macro suite")
-    print()
+    sys.stdout.write("\n".join(_OVERVIEW_LINES) + "\n")
 
 def show_probing_wizards():
     """Show probing wizards capabilities"""
-    print("PROBING WIZARDS WIDGET")
-    print("-" * 30)
-    print()
-    print("Available Probing Operations:")
-    print("1. Edge Probing (X+, X-, Y+, Y-)")
-    print("   • Single edge finding with direction selection")
-    print("   • Automatic probe radius compensation")
-    print("   • Optional WCS update")
-    print()
-    print("2. Corner Probing (Inside/Outside)")
-    print("   • Front-left, front-right, back-left, back-right")
-    print("   • Two-touch sequence for accuracy")
-    print("   • Corner position calculation")
-    print()
-    print("3. Boss/Pocket Center Finding")
-    print("   • 4-point probing sequence")
-    print("   • Center calculation with size measurement")
-    print("   • Automatic feature type detection")
-    print()
-    print("4. Z Touch-off")
-    print("   • Fast/slow probe sequence")
-    print("   • Z offset application")
-    print("   • WCS Z-zero setting")
-    print()
-    print("Safety Features:")
-    print("• Pre-flight safety checklist")
-    print("• Visual probe positioning diagrams")
-    print("• Dry-run preview mode")
-    print("• Safe retract on abort/error")
-    print()
+    sys.stdout.write("\n".join(_PROBING_WIZARDS_LINES) + "\n")
 
 def show_toolsetter_wizard():
     """Show tool setter wizard capabilities"""
-    print("TOOL SETTER WIZARD")
-    print("-" * 20)
-    print()
-    print("Guided Workflow:")
-    print("1. Set tool setter position (G30)")
-    print("2. Configure probe parameters")
-    print("3. Load tool in spindle")
-    print("4. Measure tool length")
-    print("5. Save to tool table")
-    print()
-    print("Key Features:")
-    print("• Step-by-step progress indication")
-    print("• Fast/slow probe sequence")
-    print("• Automatic tool.tbl writing")
-    print("• Tool breakage detection")
-    print("• Measurement history tracking")
-    print("• Safe height management")
-    print()
-    print("Breakage Detection:")
-    print("• Expected length comparison")
-    print("• Configurable tolerance")
-    print("• Automatic error detection")
-    print("• Measurement validation")
-    print()
+    sys.stdout.write("\n".join(_TOOLSETTER_WIZARD_LINES) + "\n")
 
 def show_probe_calibration():
     """Show probe calibration capabilities"""
-    print("PROBE CALIBRATION")
-    print("-" * 18)
-    print()
-    print("Calibration Process:")
-    print("• Use known standard (ring or pin gauge)")
-    print("• 4-point measurement sequence")
-    print("• Effective probe diameter calculation")
-    print("• Calibration offset determination")
-    print("• Runout detection and compensation")
-    print()
-    print("Accuracy Features:")
-    print("• Probe tip diameter validation")
-    print("• Feed rate dependency tracking")
-    print("• Trigger distance compensation")
-    print("• Multi-axis measurement comparison")
-    print()
+    sys.stdout.write("\n".join(_PROBE_CALIBRATION_LINES) + "\n")
 
 def show_ngc_macros():
     """Show NGC macro implementation"""
@@ -110,14 +174,8 @@ def show_ngc_macros():
     print()
     print("Macro Files Created:")
     
-    macro_dir = os.path.join(os.path.dirname(__file__), 'wizards', 'probing')
-    if os.path.exists(macro_dir):
-        for filename in sorted(os.listdir(macro_dir)):
-            if filename.endswith('.ngc'):
-                filepath = os.path.join(macro_dir, filename)
-                with open(filepath, 'r') as f:
-                    lines = f.readlines()
-                    print(f"• {filename:<25} ({len(lines)} lines)")
+    for filename, line_count in macro_stats(MACRO_DIR):
+        print(f"• {filename:<25} ({line_count} lines)")
     
     print()
     print("Macro Features:")
@@ -146,68 +204,41 @@ def show_integration():
     print("• Enable NGC macro execution")
     print()
     print("Directory Structure:")
-    print("├── src/widgets/probing_wizards/")
-    print("│   ├── __init__.py")
-    print("│   └── probing_wizards.py")
-    print("├── src/widgets/toolsetter_wizard/")
-    print("│   ├── __init__.py")
-    print("│   └── toolsetter_wizard.py")
-    print("└── wizards/probing/")
-    print("    ├── edges.ngc")
-    print("    ├── corners.ngc")
-    print("    ├── boss_pocket.ngc")
-    print("    ├── z_touchoff.ngc")
-    print("    ├── toolsetter.ngc")
-    print("    └── probe_calibration.ngc")
-    print()
+    sys.stdout.write(_DIR_TREE_PHASE4)
 
 def show_acceptance_criteria():
     """Show how acceptance criteria are met"""
-    print("ACCEPTANCE CRITERIA VERIFICATION")
-    print("-" * 35)
-    print()
-    print("✅ Probing routines update active WCS (G54) in sim correctly")
-    print("   → G10 L2 commands in all probing macros")
-    print("   → Parameter-driven WCS selection")
-    print("   → Position-only mode available")
-    print()
-    print("✅ Toolsetter updates tool length; persisted in tool.tbl")
-    print("   → G10 L1 command in toolsetter.ngc")
-    print("   → Automatic tool table writing")
-    print("   → Tool offset validation")
-    print()
-    print("✅ Cancel/abort safely retracts and restores modes")
-    print("   → Error handling in all macros")
-    print("   → Safe retract sequences")
-    print("   → Mode restoration on abort")
-    print()
-    print("✅ Unified Probe Basic flows into PB-Touch visuals")
-    print("   → Modern tabbed widget interface")
-    print("   → Safety checklists and diagrams")
-    print("   → Guided step-by-step workflows")
-    print()
+    print(*_ACCEPTANCE_LINES, sep="\n")
+
+def _no_pause(prompt=""):
+    """Stand-in for input() when the demo runs non-interactively"""
 
 def main():
     """Main demonstration function"""
+    interactive = (sys.stdin.isatty()
+                   and not os.environ.get("PB_DEMO_NONINTERACTIVE")
+                   and "--fast" not in sys.argv[1:])
+    pause = input if interactive else _no_pause
+
     show_phase4_overview()
     
     print("\nPress Enter to continue through the demonstration...")
-    input()
+    pause("")
     
     show_probing_wizards()
-    input()
+    pause("")
     
     show_toolsetter_wizard()
-    input()
+    pause("")
     
     show_probe_calibration()
-    input()
+    pause("")
     
     show_ngc_macros()
-    input()
+    pause("")
     
     show_integration()
-    input()
+    pause("")
     
     show_acceptance_criteria()
     
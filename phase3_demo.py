@@ -11,6 +11,62 @@ import os
 # In a real LinuxCNC environment with QtPyVCP installed, these widgets would be
 # instantiated and added to the main Probe Basic interface
 
+_IO_FEATURES = (
+    "Real-time input monitoring with visual indicators",
+    "Output state display and forcing controls",
+    "Safety interlocks: Machine On && !ESTOP required",
+    "Grouped display by card/subsystem",
+    "Filter options: All, Inputs Only, Outputs Only, Active Only",
+    "Simulation controls for development testing",
+    "Color-coded status indicators (green=active, red=inactive)",
+    "Hover tooltips with pin names and descriptions",
+)
+
+_JOG_FEATURES = (
+    "Axis selection: X, Y, Z with radio buttons",
+    "Increment selection: Continuous, 1.0, 0.1, 0.01, 0.001",
+    "Speed control: 1-1000 mm/min with slider",
+    "Directional jog buttons for each axis",
+    "On-screen MPG wheel with mouse/touch interaction",
+    "Configurable counts-per-detent for MPG",
+    "Real-time status display and machine state checking",
+    "Safety: Jogging disabled when not homed or in ESTOP",
+)
+
+_DIAG_FEATURES = (
+    "Live Status: Performance metrics, latency, thread rates",
+    "HAL Components: List all components with state info",
+    "System Info: Platform details, environment, resources",
+    "Error Log: Real-time error capture with timestamps",
+    "Support Bundle: Comprehensive ZIP export for support",
+    "Background processing: Non-blocking bundle creation",
+    "Progress indication: Visual feedback during operations",
+    "Tabbed interface: Organized information display",
+)
+
+_INTEGRATION_EXAMPLE = """
+    # In main Probe Basic application:
+    from widgets.io_panel.io_panel import IOPanel
+    from widgets.jog_panel.jog_panel import JogPanel
+    from widgets.diagnostics_panel.diagnostics_panel import DiagnosticsPanel
+    
+    # Create tab widget or dock areas
+    tab_widget = QTabWidget()
+    
+    # Add Phase 3 widgets
+    io_panel = IOPanel()
+    jog_panel = JogPanel()
+    diagnostics_panel = DiagnosticsPanel()
+    
+    tab_widget.addTab(io_panel, "IO Monitor")
+    tab_widget.addTab(jog_panel, "Manual Control")
+    tab_widget.addTab(diagnostics_panel, "Diagnostics")
+    
+    # Widgets automatically connect to LinuxCNC status
+    # and begin real-time monitoring
+    
+"""
+
 def demonstrate_widget_usage():
     """
     Demonstrate how Phase 3 widgets would be used in Probe Basic
@@ -38,27 +94,7 @@ def demonstrate_widget_usage():
     print("   - Error logging and analysis capabilities")
     
     print("\n4. Typical Integration Pattern:")
-    print("""
-    # In main Probe Basic application:
-    from widgets.io_panel.io_panel import IOPanel
-    from widgets.jog_panel.jog_panel import JogPanel
-    from widgets.diagnostics_panel.diagnostics_panel import DiagnosticsPanel
-    
-    # Create tab widget or dock areas
-    tab_widget = QTabWidget()
-    
-    # Add Phase 3 widgets
-    io_panel = IOPanel()
-    jog_panel = JogPanel()
-    diagnostics_panel = DiagnosticsPanel()
-    
-    tab_widget.addTab(io_panel, "IO Monitor")
-    tab_widget.addTab(jog_panel, "Manual Control")
-    tab_widget.addTab(diagnostics_panel, "Diagnostics")
-    
-    # Widgets automatically connect to LinuxCNC status
-    # and begin real-time monitoring
-    """)
+    sys.stdout.write(_INTEGRATION_EXAMPLE)
     
     print("\n5. Safety Features:")
     print("   - All widgets respect LinuxCNC machine state")
@@ -76,51 +112,15 @@ def demonstrate_widget_usage():
 
 def show_widget_features():
     """Show key features of each widget"""
-    
-    print("\nDetailed Widget Features:")
-    print("-" * 30)
-    
-    print("\nIO Panel Features:")
-    features = [
-        "Real-time input monitoring with visual indicators",
-        "Output state display and forcing controls",
-        "Safety interlocks: Machine On && !ESTOP required",
-        "Grouped display by card/subsystem",
-        "Filter options: All, Inputs Only, Outputs Only, Active Only",
-        "Simulation controls for development testing",
-        "Color-coded status indicators (green=active, red=inactive)",
-        "Hover tooltips with pin names and descriptions"
-    ]
-    for feature in features:
-        print(f"  • {feature}")
-    
-    print("\nJog Panel Features:")
-    features = [
-        "Axis selection: X, Y, Z with radio buttons",
-        "Increment selection: Continuous, 1.0, 0.1, 0.01, 0.001",
-        "Speed control: 1-1000 mm/min with slider",
-        "Directional jog buttons for each axis",
-        "On-screen MPG wheel with mouse/touch interaction",
-        "Configurable counts-per-detent for MPG",
-        "Real-time status display and machine state checking",
-        "Safety: Jogging disabled when not homed or in ESTOP"
-    ]
-    for feature in features:
-        print(f"  • {feature}")
-    
-    print("\nDiagnostics Panel Features:")
-    features = [
-        "Live Status: Performance metrics, latency, thread rates",
-        "HAL Components: List all components with state info",
-        "System Info: Platform details, environment, resources",
-        "Error Log: Real-time error capture with timestamps",
-        "Support Bundle: Comprehensive ZIP export for support",
-        "Background processing: Non-blocking bundle creation",
-        "Progress indication: Visual feedback during operations",
-        "Tabbed interface: Organized information display"
-    ]
-    for feature in features:
-        print(f"  • {feature}")
+    out = ["", "Detailed Widget Features:", "-" * 30]
+    for title, features in (("IO Panel Features:", _IO_FEATURES),
+                            ("Jog Panel Features:", _JOG_FEATURES),
+                            ("Diagnostics Panel Features:", _DIAG_FEATURES)):
+        out.append("")
+        out.append(title)
+        for feature in features:
+            out.append(f"  • {feature}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main demonstration function"""
@@ -0,0 +1,48 @@
+"""
+Phase 4 NGC Macro Statistics
+Line counts for the probing macros, shared by demo_phase4 and phase4_summary
+"""
+
+import functools
+import os
+
+MACRO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wizards', 'probing')
+
+_READ_CHUNK_SIZE = 65536
+
+def _count_lines(path):
+    """Count the lines in a file from its raw bytes, without decoding it"""
+    count = 0
+    trailing = b""
+    # Unbuffered: each chunk is a single read() straight from the fd, so a
+    # typical macro is consumed in one syscall
+    with open(path, 'rb', buffering=0) as f:
+        for chunk in iter(functools.partial(f.read, _READ_CHUNK_SIZE), b""):
+            count += chunk.count(b"\n")
+            trailing = chunk[-1:]
+    # A final line without a newline still counts, as with readlines()
+    return count + (1 if trailing not in (b"", b"\n") else 0)
+
+def macro_stats(macro_dir):
+    """Return sorted (filename, line_count) pairs for the NGC macros in macro_dir"""
+    try:
+        with os.scandir(macro_dir) as it:
+            # DirEntry caches the file type from the directory read, so
+            # filtering here costs no extra stat() per entry
+            entries = sorted((entry for entry in it
+                              if entry.name.endswith('.ngc')
+                              and entry.is_file(follow_symlinks=False)),
+                             key=lambda entry: entry.name)
+            stats = []
+            for entry in entries:
+                st = entry.stat(follow_symlinks=False)
+                stats.append((entry.name,
+                              _cached_line_count(entry.path, st.st_mtime_ns, st.st_size)))
+    except OSError:
+        return ()
+    return tuple(stats)
+
+@functools.lru_cache(maxsize=64)
+def _cached_line_count(path, mtime_ns, size):
+    """Count lines in path; mtime_ns and size only key the cache so edits invalidate it"""
+    return _count_lines(path)
@@ -4,126 +4,135 @@ Phase 4 Probing & Tool Setting Wizards - Summary Report
 Complete implementation overview for PB-Touch
 """
 
+import functools
 import os
+import sys
+
+from phase4_macros import MACRO_DIR, macro_stats
+
+_OPERATIONS = (
+    ("Edge Probing", "X/Y single edge finding with direction selection"),
+    ("Corner Probing", "Inside/outside corners with 2-touch sequence"),
+    ("Boss/Pocket Center", "4-point center finding with size measurement"),
+    ("Z Touch-off", "Surface setting with offset application"),
+    ("Tool Length Setting", "Guided tool measurement with breakage detection"),
+    ("Probe Calibration", "Tip diameter calibration with runout detection"),
+)
+
+_IMPROVEMENTS = (
+    "Unified visual interface vs scattered dialogs",
+    "Safety checklists vs manual verification",
+    "Visual diagrams vs text-only instructions",
+    "Guided workflows vs expert-only operation",
+    "Parameter validation vs manual entry errors",
+    "Dry-run preview vs blind execution",
+    "Integrated calibration vs external tools",
+    "Modern UI vs legacy appearance",
+)
+_IMPROVEMENT_BULLETS = tuple(f"• {improvement}" for improvement in _IMPROVEMENTS)
+
+_FILE_TREE = """\
+├── src/widgets/
+│   ├── probing_wizards/
+│   │   ├── __init__.py
+│   │   └── probing_wizards.py      (23KB, main widget)
+│   └── toolsetter_wizard/
+│       ├── __init__.py
+│       └── toolsetter_wizard.py    (16KB, tool setter)
+└── wizards/probing/
+    ├── edges.ngc                   (Edge probing)
+    ├── corners.ngc                 (Corner probing)
+    ├── boss_pocket.ngc             (Boss/pocket center)
+    ├── z_touchoff.ngc              (Z touch-off)
+    ├── toolsetter.ngc              (Tool length setting)
+    └── probe_calibration.ngc       (Probe calibration)"""
+
+@functools.lru_cache(maxsize=4)
+def _rendered_summary(stats):
+    """Render the full report; keyed on the macro stats, or None without a macro directory"""
+    out = []
+    out.append("=" * 80)
+    out.append("PHASE 4 - PROBING & TOOL SETTING WIZARDS")
+    out.append("IMPLEMENTATION COMPLETE ✅")
+    out.append("=" * 80)
+
+    out.append("\n📋 DELIVERABLES COMPLETED:")
+    out.append("• Probing Wizards Widget Package")
+    out.append("• Tool Setter Wizard Widget")
+    out.append("• Complete NGC Macro Suite (6 macros)")
+    out.append("• Safety Checklists and Visual Diagrams")
+    out.append("• WCS and Tool Table Update Systems")
+    out.append("• Probe Calibration Functionality")
+    out.append("• Comprehensive Test Suite")
+
+    out.append("\n🎯 ACCEPTANCE CRITERIA MET:")
+    out.append("✅ Probing routines update active WCS (G54) in sim correctly")
+    out.append("✅ Toolsetter updates tool length; persisted in tool.tbl")
+    out.append("✅ Cancel/abort safely retracts and restores modes")
+    out.append("✅ Unified Probe Basic flows into PB-Touch visuals")
+
+    out.append("\n🔧 PROBING OPERATIONS IMPLEMENTED:")
+    for op, desc in _OPERATIONS:
+        out.append(f"• {op:<20}: {desc}")
+
+    out.append("\n🔩 NGC MACRO DETAILS:")
+    if stats is not None:
+        total_lines = 0
+        for filename, lines in stats:
+            total_lines += lines
+            out.append(f"• {filename:<25}: {lines:>3} lines")
+        out.append(f"  Total: {len(stats)} macros, {total_lines} lines of G-code")
+
+    out.append("\n🎨 WIDGET FEATURES:")
+    out.append("• Tabbed interface for different probe types")
+    out.append("• Visual probe positioning diagrams")
+    out.append("• Safety checklists with mandatory completion")
+    out.append("• Parameter validation and range checking")
+    out.append("• Dry-run preview mode")
+    out.append("• Step-by-step guided workflows")
+    out.append("• Real-time progress tracking")
+    out.append("• Error handling and safe abort")
+
+    out.append("\n⚙️ TECHNICAL IMPLEMENTATION:")
+    out.append("• QtPyVCP widget framework integration")
+    out.append("• Signal/slot architecture for LinuxCNC")
+    out.append("• Parameter system for G-code communication")
+    out.append("• G10 L2 commands for WCS updates")
+    out.append("• G10 L1 commands for tool table updates")
+    out.append("• G38.2 probing with error checking")
+    out.append("• Safety interlocks and validation")
+
+    out.append("\n📁 FILE STRUCTURE:")
+    out.append(_FILE_TREE)
+
+    out.append("\n🧪 TESTING & VALIDATION:")
+    out.append("• Comprehensive test suite with 100% functionality coverage")
+    out.append("• Widget structure validation")
+    out.append("• NGC macro syntax verification")
+    out.append("• Parameter range validation")
+    out.append("• Integration readiness testing")
+
+    out.append("\n🚀 INTEGRATION READY:")
+    out.append("• Widgets registered for QtDesigner")
+    out.append("• Compatible with existing Probe Basic architecture")
+    out.append("• Drop-in replacement for legacy probing")
+    out.append("• Modern PB-Touch visual design")
+    out.append("• Ready for immediate deployment")
+
+    out.append("\n💡 KEY IMPROVEMENTS OVER LEGACY:")
+    out.extend(_IMPROVEMENT_BULLETS)
+
+    out.append("\n" + "=" * 80)
+    out.append("🎉 PHASE 4 IMPLEMENTATION COMPLETE")
+    out.append("Ready for integration into PB-Touch interface!")
+    out.append("All acceptance criteria satisfied with comprehensive testing.")
+    out.append("=" * 80)
+    return "\n".join(out) + "\n"
 
 def generate_summary_report():
     """Generate a complete summary of Phase 4 implementation"""
-    
-    print("=" * 80)
-    print("PHASE 4 - PROBING & TOOL SETTING WIZARDS")
-    print("IMPLEMENTATION COMPLETE ✅")
-    print("=" * 80)
-    
-    print("\n📋 DELIVERABLES COMPLETED:")
-    print("• Probing Wizards Widget Package")
-    print("• Tool Setter Wizard Widget")
-    print("• Complete NGC Macro Suite (6 macros)")
-    print("• Safety Checklists and Visual Diagrams")
-    print("• WCS and Tool Table Update Systems")
-    print("• Probe Calibration Functionality")
-    print("• Comprehensive Test Suite")
-    
-    print("\n🎯 ACCEPTANCE CRITERIA MET:")
-    print("✅ Probing routines update active WCS (G54) in sim correctly")
-    print("✅ Toolsetter updates tool length; persisted in tool.tbl")
-    print("✅ Cancel/abort safely retracts and restores modes")
-    print("✅ Unified Probe Basic flows into PB-Touch visuals")
-    
-    print("\n🔧 PROBING OPERATIONS IMPLEMENTED:")
-    operations = [
-        ("Edge Probing", "X/Y single edge finding with direction selection"),
-        ("Corner Probing", "Inside/outside corners with 2-touch sequence"),
-        ("Boss/Pocket Center", "4-point center finding with size measurement"),
-        ("Z Touch-off", "Surface setting with offset application"),
-        ("Tool Length Setting", "Guided tool measurement with breakage detection"),
-        ("Probe Calibration", "Tip diameter calibration with runout detection")
-    ]
-    
-    for op, desc in operations:
-        print(f"• {op:<20}: {desc}")
-    
-    print("\n🔩 NGC MACRO DETAILS:")
-    macro_dir = os.path.join(os.path.dirname(__file__), 'wizards', 'probing')
-    if os.path.exists(macro_dir):
-        total_lines = 0
-        for filename in sorted(os.listdir(macro_dir)):
-            if filename.endswith('.ngc'):
-                filepath = os.path.join(macro_dir, filename)
-                with open(filepath, 'r') as f:
-                    lines = len(f.readlines())
-                    total_lines += lines
-                    print(f"• {filename:<25}: {lines:>3} lines")
-        print(f"  Total: {len([f for f in os.listdir(macro_dir) if f.endswith('.ngc')])} macros, {total_lines} lines of G-code")
-    
-    print("\n🎨 WIDGET FEATURES:")
-    print("• Tabbed interface for different probe types")
-    print("• Visual probe positioning diagrams")
-    print("• Safety checklists with mandatory completion")
-    print("• Parameter validation and range checking")
-    print("• Dry-run preview mode")
-    print("• Step-by-step guided workflows")
-    print("• Real-time progress tracking")
-    print("• Error handling and safe abort")
-    
-    print("\n⚙️ TECHNICAL IMPLEMENTATION:")
-    print("• QtPyVCP widget framework integration")
-    print("• Signal/slot architecture for LinuxCNC")
-    print("• Parameter system for G-code communication") 
-    print("• G10 L2 commands for WCS updates")
-    print("• G10 L1 commands for tool table updates")
-    print("• G38.2 probing with error checking")
-    print("• Safety interlocks and validation")
-    
-    print("\n📁 FILE STRUCTURE:")
-    print("├── src/widgets/")
-    print("│   ├── probing_wizards/")
-    print("│   │   ├── __init__.py")
-    print("│   │   └── probing_wizards.py      (23KB, main widget)")
-    print("│   └── toolsetter_wizard/")
-    print("│       ├── __init__.py")
-    print("│       └── toolsetter_wizard.py    (16KB, tool setter)")
-    print("└── wizards/probing/")
-    print("    ├── edges.ngc                   (Edge probing)")
-    print("    ├── corners.ngc                 (Corner probing)")
-    print("    ├── boss_pocket.ngc             (Boss/pocket center)")
-    print("    ├── z_touchoff.ngc              (Z touch-off)")
-    print("    ├── toolsetter.ngc              (Tool length setting)")
-    print("    └── probe_calibration.ngc       (Probe calibration)")
-    
-    print("\n🧪 TESTING & VALIDATION:")
-    print("• Comprehensive test suite with 100% functionality coverage")
-    print("• Widget structure validation")
-    print("• NGC macro syntax verification")
-    print("• Parameter range validation")
-    print("• Integration readiness testing")
-    
-    print("\n🚀 INTEGRATION READY:")
-    print("• Widgets registered for QtDesigner")
-    print("• Compatible with existing Probe Basic architecture")
-    print("• Drop-in replacement for legacy probing")
-    print("• Modern PB-Touch visual design")
-    print("• Ready for immediate deployment")
-    
-    print("\n💡 KEY IMPROVEMENTS OVER LEGACY:")
-    improvements = [
-        "Unified visual interface vs scattered dialogs",
-        "Safety checklists vs manual verification",
-        "Visual diagrams vs text-only instructions", 
-        "Guided workflows vs expert-only operation",
-        "Parameter validation vs manual entry errors",
-        "Dry-run preview vs blind execution",
-        "Integrated calibration vs external tools",
-        "Modern UI vs legacy appearance"
-    ]
-    
-    for improvement in improvements:
-        print(f"• {improvement}")
-    
-    print("\n" + "=" * 80)
-    print("🎉 PHASE 4 IMPLEMENTATION COMPLETE")
-    print("Ready for integration into PB-Touch interface!")
-    print("All acceptance criteria satisfied with comprehensive testing.")
-    print("=" * 80)
+    stats = macro_stats(MACRO_DIR) if os.path.isdir(MACRO_DIR) else None
+    sys.stdout.write(_rendered_summary(stats))
 
 if __name__ == "__main__":
     generate_summary_report()
\ No newline at end of file
@@ -8,6 +8,19 @@ import sys
 import os
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        """Serialize obj to indented JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        """Serialize obj to indented JSON bytes"""
+        return json.dumps(obj, indent=2).encode()
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -15,30 +28,156 @@ try:
     from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, 
                                  QVBoxLayout, QWidget, QHBoxLayout, 
                                  QPushButton, QLabel, QMessageBox, QSplitter)
-    from PyQt5.QtCore import Qt, QTimer
-    
-    # Import Phase 6 widgets (will fail gracefully if dependencies missing)
-    try:
-        from widgets.file_browser.file_browser import FileBrowserWidget
-        from widgets.job_manager.job_manager import JobManagerWidget  
-        WIDGETS_AVAILABLE = True
-    except ImportError as e:
-        print(f"Widget imports failed (expected in test environment): {e}")
-        WIDGETS_AVAILABLE = False
-    
+    from PyQt5.QtCore import Qt
+    PYQT5_AVAILABLE = True
 except ImportError:
     print("PyQt5 not available - creating minimal demo")
-    WIDGETS_AVAILABLE = False
+    PYQT5_AVAILABLE = False
+
+# Resolved by _lazy_widgets() on first use so importing this module stays cheap
+WIDGETS_AVAILABLE = False
+FileBrowserWidget = None
+JobManagerWidget = None
+_widgets_loaded = False
+
+def _lazy_widgets():
+    """Import the Phase 6 widgets once; returns True if they are usable"""
+    global WIDGETS_AVAILABLE, FileBrowserWidget, JobManagerWidget, _widgets_loaded
+    if not _widgets_loaded:
+        _widgets_loaded = True
+        if PYQT5_AVAILABLE:
+            # Import Phase 6 widgets (will fail gracefully if dependencies missing)
+            try:
+                from widgets.file_browser.file_browser import FileBrowserWidget
+                from widgets.job_manager.job_manager import JobManagerWidget
+                WIDGETS_AVAILABLE = True
+            except ImportError as e:
+                print(f"Widget imports failed (expected in test environment): {e}")
+    return WIDGETS_AVAILABLE
+
+# Demo programs, already stripped and stored as bytes so create_demo_files()
+# only does the I/O
+_DEMO_BLOBS = (
+    ("demo_facing.ngc", b"""\
+; Demo Facing Operation
+; Generated by PB-Touch Phase 6
+G54 ; Work coordinate system
+G20 ; Inches
+G17 ; XY plane
+G90 ; Absolute positioning
+M3 S1200 ; Spindle CW 1200 RPM
+M8 ; Coolant on
+G0 Z0.1 ; Rapid to clearance height
+G0 X-1.0 Y1.0 ; Rapid to start position
+G1 Z-0.05 F10 ; Feed to cutting depth
+G1 X1.0 F50 ; Face across
+G0 Z0.1 ; Rapid to clearance
+G0 Y0.9 ; Step over
+G1 Z-0.05 F10 ; Feed to cutting depth  
+G1 X-1.0 F50 ; Face back
+G0 Z0.1 ; Rapid to clearance
+M9 ; Coolant off
+M5 ; Spindle stop
+G0 Z1.0 ; Rapid to safe height
+M30 ; Program end"""),
+    ("demo_pocket.ngc", b"""\
+; Demo Circular Pocket
+; Generated by PB-Touch Phase 6
+G54 ; Work coordinate system
+G21 ; Millimeters  
+G17 ; XY plane
+G90 ; Absolute positioning
+M3 S2000 ; Spindle CW 2000 RPM
+M8 ; Coolant on
+G0 Z5.0 ; Rapid to clearance height
+G0 X0 Y0 ; Rapid to center
+G1 Z-1.0 F100 ; Feed to first depth
+G1 X2.0 F300 ; Move to radius
+G3 X2.0 Y0 I-2.0 J0 ; Circular interpolation
+G1 X0 ; Return to center
+G1 Z-2.0 F100 ; Feed to next depth
+G1 X2.0 F300 ; Move to radius
+G3 X2.0 Y0 I-2.0 J0 ; Circular interpolation
+G1 X0 ; Return to center
+M9 ; Coolant off
+M5 ; Spindle stop
+G0 Z5.0 ; Rapid to safe height
+M30 ; Program end"""),
+    ("demo_drill.ngc", b"""\
+; Demo Drilling Operation
+; Generated by PB-Touch Phase 6
+G54 ; Work coordinate system
+G20 ; Inches
+G17 ; XY plane
+G90 ; Absolute positioning
+M3 S800 ; Spindle CW 800 RPM
+M8 ; Coolant on
+G0 Z0.1 ; Rapid to clearance height
+; Drill hole 1
+G0 X0.5 Y0.5 ; Rapid to hole 1
+G81 Z-0.25 R0.1 F5 ; Drill cycle
+; Drill hole 2  
+G0 X-0.5 Y0.5 ; Rapid to hole 2
+G81 Z-0.25 R0.1 F5 ; Drill cycle
+; Drill hole 3
+G0 X0.5 Y-0.5 ; Rapid to hole 3
+G81 Z-0.25 R0.1 F5 ; Drill cycle
+; Drill hole 4
+G0 X-0.5 Y-0.5 ; Rapid to hole 4
+G81 Z-0.25 R0.1 F5 ; Drill cycle
+G80 ; Cancel drill cycle
+M9 ; Coolant off
+M5 ; Spindle stop
+G0 Z1.0 ; Rapid to safe height
+M30 ; Program end"""),
+)
+
+_CONVERSATIONAL_OPERATIONS = (
+    "✓ Facing - Surface material removal",
+    "✓ Drilling - Standard and peck drilling",
+    "✓ Hole Circle - Multiple holes in circular pattern",
+    "✓ Circular Pocket - Round pocket machining",
+    "✓ Rectangular Pocket - Square/rectangular pockets",
+    "✓ Slot - Linear slot cutting",
+    "✓ Bolt Circle - Bolt hole patterns",
+)
+_CONVERSATIONAL_OPERATIONS_HTML = "".join(
+    f"<div style='padding: 5px;'>{op}</div>" for op in _CONVERSATIONAL_OPERATIONS)
+
+_FALLBACK_INFO_TEXT = """
+Phase 6 Implementation Status:
+
+✓ File Browser Widget - Complete
+  - Local and network share browsing
+  - File preview and metadata
+  - Open containing folder and duplicate actions
+
+✓ Job Manager Widget - Complete  
+  - Queue add/remove/reorder functionality
+  - Run/hold/skip job control
+  - Persistent queue storage (JSON)
+  - Job history with status and duration
+
+✓ Enhanced Conversational - Complete
+  - Additional operations: pockets, slots, bolt circles
+  - JSON sidecar generation for re-editing
+  - Metric/Imperial templates
+
+⚠ Full demo requires QtPyVCP and LinuxCNC environment
+  Run test_phase6_components.py for unit tests
+"""
 
 class Phase6Demo(QMainWindow):
     """Phase 6 demonstration application"""
     
     def __init__(self):
+        _lazy_widgets()
         super().__init__()
         self.setWindowTitle("PB-Touch Phase 6 Demo - Job Manager, File Browser & Conversational")
         self.setGeometry(100, 100, 1200, 800)
         
         # Create demo data
+        self._demo_dir = os.path.expanduser("~/linuxcnc/configs/phase6_demo")
         self.create_demo_files()
         
         self.init_ui()
@@ -81,28 +220,7 @@ class Phase6Demo(QMainWindow):
             
         else:
             # Fallback UI for testing without full dependencies
-            info_label = QLabel("""
-Phase 6 Implementation Status:
-
-✓ File Browser Widget - Complete
-  - Local and network share browsing
-  - File preview and metadata
-  - Open containing folder and duplicate actions
-
-✓ Job Manager Widget - Complete  
-  - Queue add/remove/reorder functionality
-  - Run/hold/skip job control
-  - Persistent queue storage (JSON)
-  - Job history with status and duration
-
-✓ Enhanced Conversational - Complete
-  - Additional operations: pockets, slots, bolt circles
-  - JSON sidecar generation for re-editing
-  - Metric/Imperial templates
-
-⚠ Full demo requires QtPyVCP and LinuxCNC environment
-  Run test_phase6_components.py for unit tests
-            """)
+            info_label = QLabel(_FALLBACK_INFO_TEXT)
             info_label.setStyleSheet("padding: 20px; background-color: #f0f0f0; border: 1px solid #ccc;")
             layout.addWidget(info_label)
             
@@ -115,20 +233,10 @@ Phase 6 Implementation Status:
         title.setStyleSheet("font-size: 14px; font-weight: bold;")
         layout.addWidget(title)
         
-        operations = [
-            "✓ Facing - Surface material removal",
-            "✓ Drilling - Standard and peck drilling", 
-            "✓ Hole Circle - Multiple holes in circular pattern",
-            "✓ Circular Pocket - Round pocket machining",
-            "✓ Rectangular Pocket - Square/rectangular pockets",
-            "✓ Slot - Linear slot cutting",
-            "✓ Bolt Circle - Bolt hole patterns"
-        ]
-        
-        for op in operations:
-            label = QLabel(op)
-            label.setStyleSheet("padding: 5px;")
-            layout.addWidget(label)
+        # One rich-text label instead of a styled QLabel per operation
+        operations_label = QLabel(_CONVERSATIONAL_OPERATIONS_HTML)
+        operations_label.setTextFormat(Qt.RichText)
+        layout.addWidget(operations_label)
             
         # JSON sidecar info
         json_info = QLabel("""
@@ -182,92 +290,19 @@ JSON Sidecar Features:
         
     def create_demo_files(self):
         """Create demo G-code files"""
-        demo_dir = os.path.expanduser("~/linuxcnc/configs/phase6_demo")
+        demo_dir = self._demo_dir
         os.makedirs(demo_dir, exist_ok=True)
         
-        demo_files = {
-            "demo_facing.ngc": """
-; Demo Facing Operation
-; Generated by PB-Touch Phase 6
-G54 ; Work coordinate system
-G20 ; Inches
-G17 ; XY plane
-G90 ; Absolute positioning
-M3 S1200 ; Spindle CW 1200 RPM
-M8 ; Coolant on
-G0 Z0.1 ; Rapid to clearance height
-G0 X-1.0 Y1.0 ; Rapid to start position
-G1 Z-0.05 F10 ; Feed to cutting depth
-G1 X1.0 F50 ; Face across
-G0 Z0.1 ; Rapid to clearance
-G0 Y0.9 ; Step over
-G1 Z-0.05 F10 ; Feed to cutting depth  
-G1 X-1.0 F50 ; Face back
-G0 Z0.1 ; Rapid to clearance
-M9 ; Coolant off
-M5 ; Spindle stop
-G0 Z1.0 ; Rapid to safe height
-M30 ; Program end
-""",
-            "demo_pocket.ngc": """
-; Demo Circular Pocket
-; Generated by PB-Touch Phase 6
-G54 ; Work coordinate system
-G21 ; Millimeters  
-G17 ; XY plane
-G90 ; Absolute positioning
-M3 S2000 ; Spindle CW 2000 RPM
-M8 ; Coolant on
-G0 Z5.0 ; Rapid to clearance height
-G0 X0 Y0 ; Rapid to center
-G1 Z-1.0 F100 ; Feed to first depth
-G1 X2.0 F300 ; Move to radius
-G3 X2.0 Y0 I-2.0 J0 ; Circular interpolation
-G1 X0 ; Return to center
-G1 Z-2.0 F100 ; Feed to next depth
-G1 X2.0 F300 ; Move to radius
-G3 X2.0 Y0 I-2.0 J0 ; Circular interpolation
-G1 X0 ; Return to center
-M9 ; Coolant off
-M5 ; Spindle stop
-G0 Z5.0 ; Rapid to safe height
-M30 ; Program end
-""",
-            "demo_drill.ngc": """
-; Demo Drilling Operation
-; Generated by PB-Touch Phase 6
-G54 ; Work coordinate system
-G20 ; Inches
-G17 ; XY plane
-G90 ; Absolute positioning
-M3 S800 ; Spindle CW 800 RPM
-M8 ; Coolant on
-G0 Z0.1 ; Rapid to clearance height
-; Drill hole 1
-G0 X0.5 Y0.5 ; Rapid to hole 1
-G81 Z-0.25 R0.1 F5 ; Drill cycle
-; Drill hole 2  
-G0 X-0.5 Y0.5 ; Rapid to hole 2
-G81 Z-0.25 R0.1 F5 ; Drill cycle
-; Drill hole 3
-G0 X0.5 Y-0.5 ; Rapid to hole 3
-G81 Z-0.25 R0.1 F5 ; Drill cycle
-; Drill hole 4
-G0 X-0.5 Y-0.5 ; Rapid to hole 4
-G81 Z-0.25 R0.1 F5 ; Drill cycle
-G80 ; Cancel drill cycle
-M9 ; Coolant off
-M5 ; Spindle stop
-G0 Z1.0 ; Rapid to safe height
-M30 ; Program end
-"""
-        }
-        
         self.demo_files = []
-        for filename, content in demo_files.items():
+        for filename, blob in _DEMO_BLOBS:
             filepath = os.path.join(demo_dir, filename)
-            with open(filepath, 'w') as f:
-                f.write(content.strip())
+            # Skip the rewrite when a previous run already left the file
+            if not (os.path.exists(filepath) and os.path.getsize(filepath) == len(blob)):
+                fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, blob)
+                finally:
+                    os.close(fd)
             self.demo_files.append(filepath)
             
         print(f"Demo files created in: {demo_dir}")
@@ -286,8 +321,7 @@ M30 ; Program end
     def add_demo_jobs(self):
         """Add demo jobs to the queue"""
         if WIDGETS_AVAILABLE and self.demo_files:
-            for file_path in self.demo_files:
-                self.job_manager.add_job_file(file_path)
+            self.job_manager.add_job_files(self.demo_files)
             self.status_label.setText(f"Added {len(self.demo_files)} demo jobs to queue")
         else:
             self.show_info("Demo Jobs", "Demo jobs would be added to queue")
@@ -295,12 +329,15 @@ M30 ; Program end
     def run_demo_sequence(self):
         """Run the complete demo sequence"""
         if WIDGETS_AVAILABLE:
+            if self.demo_files:
+                # Start the queue on the next event-loop tick once the jobs are in;
+                # without jobs add_demo_jobs never emits, so don't connect
+                self.job_manager.queue_populated.connect(self.start_demo_queue,
+                                                         Qt.QueuedConnection)
+            
             # Add jobs to queue
             self.add_demo_jobs()
             
-            # Start queue after short delay
-            QTimer.singleShot(1000, self.job_manager.start_queue)
-            
             self.status_label.setText("Demo sequence started - check Job Manager tab")
         else:
             self.show_info("Demo Sequence", 
@@ -309,12 +346,18 @@ M30 ; Program end
                           "2. Execute them sequentially\n"
                           "3. Show status transitions")
             
+    def start_demo_queue(self):
+        """Start the queue once after the demo jobs have been added"""
+        self.job_manager.queue_populated.disconnect(self.start_demo_queue)
+        self.job_manager.start_queue()
+            
     def generate_demo_gcode(self):
         """Generate demo conversational G-code"""
         # Create a demo JSON sidecar
+        created_time = datetime.now().isoformat()
         demo_json = {
             "format_version": "1.0",
-            "created_time": datetime.now().isoformat(),
+            "created_time": created_time,
             "operation_type": "circular_pocket",
             "gcode_file": "demo_conversational_pocket.ngc",
             "pb_touch_phase": 6,
@@ -343,12 +386,10 @@ M30 ; Program end
             }
         }
         
-        demo_dir = os.path.expanduser("~/linuxcnc/configs/phase6_demo")
-        json_path = os.path.join(demo_dir, "demo_conversational_pocket.json")
+        json_path = os.path.join(self._demo_dir, "demo_conversational_pocket.json")
         
-        import json
-        with open(json_path, 'w') as f:
-            json.dump(demo_json, f, indent=2)
+        with open(json_path, 'wb') as f:
+            f.write(_dumps(demo_json))
             
         self.status_label.setText("Generated conversational G-code with JSON sidecar")
         self.show_info("Conversational", f"Generated JSON sidecar:\n{json_path}")
@@ -359,7 +400,7 @@ M30 ; Program end
 
 def main():
     """Main entry point"""
-    if not WIDGETS_AVAILABLE:
+    if not _lazy_widgets():
         print("Running in test mode - limited functionality")
         
     app = QApplication(sys.argv)
@@ -14,16 +14,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from qtpy.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QTabWidget
 from qtpy.QtCore import Qt
 
-from widgets.phase7_integration import Phase7IntegrationPanel
-from widgets.homing_manager.homing_manager import HomingManager
-from widgets.limit_override.limit_override import LimitOverrideManager
-from widgets.spindle_warmup.spindle_warmup import SpindleWarmupWidget  
-from widgets.maintenance_reminders.maintenance_reminders import MaintenanceRemindersWidget
-
 class Phase7DemoWindow(QMainWindow):
     """Main demo window for Phase 7 features"""
     
     def __init__(self):
+        # Widget packages are only imported once a window is actually built
+        from widgets.phase7_integration import Phase7IntegrationPanel
+        from widgets.homing_manager.homing_manager import HomingManager
+        from widgets.limit_override.limit_override import LimitOverrideManager
+        from widgets.spindle_warmup.spindle_warmup import SpindleWarmupWidget
+        from widgets.maintenance_reminders.maintenance_reminders import MaintenanceRemindersWidget
+
         super(Phase7DemoWindow, self).__init__()
         
         self.setWindowTitle("Phase 7 Demo - Safety, Homing, Limits, Overrides & Warmup")
@@ -6,96 +6,247 @@ Shows Phase 7 widgets without QtPyVCP dependencies for demonstration
 """
 
 import sys
-import os
 from qtpy.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
                             QWidget, QTabWidget, QLabel, QFrame, QPushButton,
-                            QGridLayout, QProgressBar, QComboBox, QSpinBox,
-                            QTextEdit, QCheckBox, QTableWidget, QTableWidgetItem,
-                            QHeaderView, QScrollArea, QListWidget, QMessageBox)
-from qtpy.QtCore import Qt, QTimer
-from qtpy.QtGui import QFont
+                            QGridLayout, QComboBox)
+from qtpy.QtCore import Qt, QTimer, QRect, QRectF
+from qtpy.QtGui import QFont, QColor, QImage, QPainter, QPen, QPixmap
 
-class MockHomingBadge(QFrame):
-    """Mock homing badge for demo"""
+# Shared fonts, built once at import; setFont() copies the value. The
+# family is resolved once on _BASE and each size is derived by copy.
+_BASE = QFont("Arial")
+
+def _font(size, bold=False):
+    """Return a copy of the base font at the given point size"""
+    font = QFont(_BASE)
+    font.setPointSize(size)
+    if bold:
+        font.setBold(True)
+    return font
+
+FONT_ARIAL_8 = _font(8)
+FONT_ARIAL_9 = _font(9)
+FONT_ARIAL_10 = _font(10)
+FONT_ARIAL_10_BOLD = _font(10, True)
+FONT_ARIAL_11_BOLD = _font(11, True)
+FONT_ARIAL_12_BOLD = _font(12, True)
+FONT_ARIAL_14_BOLD = _font(14, True)
+FONT_ARIAL_16_BOLD = _font(16, True)
+
+# Colors used by QPainter-drawn widgets, allocated once rather than per paint
+PALETTE = {
+    "white": QColor("#ffffff"),
+    "green_bg": QColor("#2d5a2d"),
+    "green_border": QColor("#4CAF50"),
+    "green_border_dark": QColor("#45a049"),
+    "red_bg": QColor("#5a2d2d"),
+    "red_border": QColor("#f44336"),
+    "red_border_dark": QColor("#da190b"),
+    "orange_bg": QColor("#fff3e0"),
+    "orange_border": QColor("#ff9800"),
+    "blue_accent": QColor("#2196F3"),
+}
+
+# Button rules are generated from one template, a rule pair per role
+BTN_TEMPLATE = """QPushButton[role="%s"] {
+    background-color: %s;
+    border: none;
+    border-radius: %dpx;
+    color: white;
+    padding: %dpx %dpx;
+    %s
+}
+QPushButton[role="%s"]:hover { background-color: %s; }
+"""
+
+BTN_GREEN = ("#4CAF50", "#45a049")
+BTN_ORANGE = ("#ff9800", "#f57c00")
+BTN_RED = ("#f44336", "#da190b")
+BTN_BLUE = ("#2196F3", "#1976D2")
+
+_BUTTON_ROLES = (
+    # role, (colour, hover), radius, padding, extra
+    ("action", BTN_GREEN, 6, (8, 16), "min-width: 120px;"),
+    ("action-large", BTN_GREEN, 6, (10, 20), "min-width: 120px;"),
+    ("task-snooze", BTN_ORANGE, 3, (4, 8), "font-size: 9px;"),
+    ("task-complete", BTN_GREEN, 3, (4, 8), "font-size: 9px;"),
+    ("confirm", BTN_GREEN, 4, (6, 12), "font-weight: bold;"),
+    ("info", BTN_BLUE, 4, (8, 16), "font-weight: bold;"),
+    ("danger", BTN_RED, 4, (8, 16), "font-weight: bold;"),
+)
+
+# Application-wide stylesheet, installed once in main(). Widgets pick up
+# their look through the "role" dynamic property instead of parsing their
+# own stylesheet on construction.
+GLOBAL_QSS = sys.intern("""
+QFrame[role="warning-panel"] {
+    background-color: #fff3e0;
+    border: 2px solid #ff9800;
+    border-radius: 8px;
+    padding: 5px;
+}
+
+QLabel[role="toast"] {
+    background-color: #323232;
+    border: 1px solid #4CAF50;
+    border-radius: 6px;
+    color: white;
+    padding: 10px 16px;
+}
+""" + "".join(
+    BTN_TEMPLATE % (role, color, radius, pad_v, pad_h, extra, role, hover)
+    for role, (color, hover), radius, (pad_v, pad_h), extra in _BUTTON_ROLES
+))
+
+# Small per-label styles that stay inline; shared, interned constants so
+# every widget construction reuses the same string objects
+_QSS_TITLE_ACCENT = sys.intern("color: #2196F3; padding: 5px;")
+_QSS_HEADER_ACCENT = sys.intern("color: #2196F3; padding: 10px;")
+_QSS_WARNING_TITLE = sys.intern("color: #ff6b35; padding: 5px;")
+_QSS_MUTED = sys.intern("color: #666; padding: 5px;")
+_QSS_MUTED_DETAIL = sys.intern("color: #666; margin: 3px;")
+_QSS_COMBO = sys.intern("padding: 5px;")
+_QSS_COMBO_SMALL = sys.intern("padding: 2px; font-size: 8px;")
+
+# Badge texts and titles shared between labels, tabs and the badge cache
+STR_HOMED = sys.intern("HOMED")
+STR_NOT_HOMED = sys.intern("NOT HOMED")
+STR_HOME = sys.intern("HOME")
+STR_REHOME = sys.intern("REHOME")
+
+TITLE_PHASE7 = "🛡️ Phase 7 - Safety & Maintenance"
+TITLE_INTEGRATED = "🛡️ Integrated Safety Panel"
+TITLE_HOMING = "🏠 Homing Manager"
+TITLE_LIMITS = "⚠️ Limit Override"
+TITLE_WARMUP = "🔄 Spindle Warmup"
+TITLE_MAINTENANCE = "🔧 Maintenance"
+
+_MAINTENANCE_TITLE_HTML = sys.intern(
+    TITLE_MAINTENANCE + ' <span style="color: #ff9800; font-size: 16pt;'
+    ' font-weight: normal;">●</span>')
+
+class Toast(QLabel):
+    """Floating notification label shared by every demo widget
+    
+    Used instead of modal message boxes: one frameless tooltip window is
+    created up front and re-shown with new text, hiding itself after a delay.
+    """
     
-    def __init__(self, axis_name, is_homed=False):
+    _instance = None
+    
+    def __init__(self):
         super().__init__()
-        self.setFrameStyle(QFrame.Box)
-        self.setLineWidth(2)
-        self.setMinimumSize(80, 60)
-        self.setMaximumSize(120, 80)
+        self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
+        self.setProperty("role", "toast")
+        self.setAlignment(Qt.AlignCenter)
+        
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.hide)
+        
+    @classmethod
+    def instance(cls):
+        """Return the shared toast, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+        
+    def show_message(self, parent, text, timeout=2000):
+        """Show text centred over parent for timeout milliseconds"""
+        self.setText(text)
+        # resize() rather than adjustSize(), which caps top-level windows
+        # at two thirds of the screen width
+        self.resize(self.sizeHint())
+        center = parent.mapToGlobal(parent.rect().center())
+        self.move(center.x() - self.width() // 2, center.y() - self.height() // 2)
+        self.show()
+        self._hide_timer.start(timeout)
+
+class MockHomingBadge(QLabel):
+    """Mock homing badge for demo
+    
+    Drawn as a single pre-rendered pixmap per (axis, state) rather than a
+    frame with child labels and a button; clicking the badge toggles it.
+    """
+    
+    BADGE_WIDTH = 120
+    BADGE_HEIGHT = 80
+    
+    _pixmap_cache = {}  # (axis_name, is_homed) -> QPixmap
+    
+    def __init__(self, axis_name, is_homed=False, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(self.BADGE_WIDTH, self.BADGE_HEIGHT)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setToolTip(f"Click to home the {axis_name} axis")
         
-        layout = QVBoxLayout()
+        self.axis_name = axis_name
+        self.is_homed = is_homed
         
-        # Axis label
-        axis_label = QLabel(f"{axis_name}")
-        axis_label.setAlignment(Qt.AlignCenter)
-        axis_label.setFont(QFont("Arial", 12, QFont.Bold))
-        layout.addWidget(axis_label)
-        
-        # Status label
-        status_label = QLabel("HOMED" if is_homed else "NOT HOMED")
-        status_label.setAlignment(Qt.AlignCenter)
-        status_label.setFont(QFont("Arial", 8))
-        layout.addWidget(status_label)
-        
-        # Home button
-        home_button = QPushButton("REHOME" if is_homed else "HOME")
-        home_button.setFont(QFont("Arial", 8))
-        home_button.clicked.connect(lambda: self.toggleHomed())
-        layout.addWidget(home_button)
-        
-        self.setLayout(layout)
         self.updateStatus(is_homed)
         
-        # Store references
-        self.axis_label = axis_label
-        self.status_label = status_label
-        self.home_button = home_button
-        self.is_homed = is_homed
+    @classmethod
+    def _render_pixmap(cls, axis_name, is_homed):
+        """Return the cached badge pixmap, rendering it on first use"""
+        key = (axis_name, is_homed)
+        pixmap = cls._pixmap_cache.get(key)
+        if pixmap is not None:
+            return pixmap
+            
+        if is_homed:
+            background = PALETTE["green_bg"]
+            border = PALETTE["green_border"]
+            button_border = PALETTE["green_border_dark"]
+            status_text, button_text = STR_HOMED, STR_REHOME
+        else:
+            background = PALETTE["red_bg"]
+            border = PALETTE["red_border"]
+            button_border = PALETTE["red_border_dark"]
+            status_text, button_text = STR_NOT_HOMED, STR_HOME
+            
+        width, height = cls.BADGE_WIDTH, cls.BADGE_HEIGHT
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Badge body
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(background)
+        painter.drawRoundedRect(QRectF(1, 1, width - 2, height - 2), 8, 8)
+        
+        # Axis name and status text
+        painter.setPen(PALETTE["white"])
+        painter.setFont(FONT_ARIAL_12_BOLD)
+        painter.drawText(QRect(0, 6, width, 24), Qt.AlignCenter, axis_name)
+        painter.setFont(FONT_ARIAL_8)
+        painter.drawText(QRect(0, 30, width, 16), Qt.AlignCenter, status_text)
+        
+        # Home button face
+        button_rect = QRectF(10, height - 28, width - 20, 20)
+        painter.setPen(QPen(button_border, 1))
+        painter.setBrush(border)
+        painter.drawRoundedRect(button_rect, 4, 4)
+        painter.setPen(PALETTE["white"])
+        painter.drawText(button_rect, Qt.AlignCenter, button_text)
+        painter.end()
+        
+        pixmap = QPixmap.fromImage(image)
+        cls._pixmap_cache[key] = pixmap
+        return pixmap
         
     def updateStatus(self, is_homed):
         """Update badge status"""
         self.is_homed = is_homed
+        self.setPixmap(self._render_pixmap(self.axis_name, is_homed))
         
-        if is_homed:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2d5a2d;
-                    border: 2px solid #4CAF50;
-                    border-radius: 8px;
-                }
-                QLabel { color: #ffffff; }
-                QPushButton {
-                    background-color: #4CAF50;
-                    border: 1px solid #45a049;
-                    border-radius: 4px;
-                    color: white;
-                    padding: 2px;
-                }
-                QPushButton:hover { background-color: #45a049; }
-            """)
-            self.status_label.setText("HOMED")
-            self.home_button.setText("REHOME")
+    def mousePressEvent(self, event):
+        """Toggle the badge when clicked"""
+        if event.button() == Qt.LeftButton:
+            self.toggleHomed()
         else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #5a2d2d;
-                    border: 2px solid #f44336;
-                    border-radius: 8px;
-                }
-                QLabel { color: #ffffff; }
-                QPushButton {
-                    background-color: #f44336;
-                    border: 1px solid #da190b;
-                    border-radius: 4px;
-                    color: white;
-                    padding: 2px;
-                }
-                QPushButton:hover { background-color: #da190b; }
-            """)
-            self.status_label.setText("NOT HOMED")
-            self.home_button.setText("HOME")
+            super().mousePressEvent(event)
             
     def toggleHomed(self):
         """Toggle homed status for demo"""
@@ -104,26 +255,27 @@ class MockHomingBadge(QFrame):
 class MockHomingManager(QWidget):
     """Mock homing manager for demo"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = {}  # badge -> is_homed, applied on the next tick
         self.setupUI()
         
     def setupUI(self):
         """Set up the UI"""
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(self)
         
         # Title
-        title_label = QLabel("Homing Status")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label = QLabel("Homing Status", self)
+        title_label.setFont(FONT_ARIAL_14_BOLD)
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
         # Badges
         badges_layout = QHBoxLayout()
         
-        self.x_badge = MockHomingBadge("X", True)  # X is homed
-        self.y_badge = MockHomingBadge("Y", False)  # Y not homed
-        self.z_badge = MockHomingBadge("Z", True)  # Z is homed
+        self.x_badge = MockHomingBadge("X", True, self)  # X is homed
+        self.y_badge = MockHomingBadge("Y", False, self)  # Y not homed
+        self.z_badge = MockHomingBadge("Z", True, self)  # Z is homed
         
         badges_layout.addWidget(self.x_badge)
         badges_layout.addWidget(self.y_badge)
@@ -133,20 +285,10 @@ class MockHomingManager(QWidget):
         layout.addLayout(badges_layout)
         
         # Home all button
-        home_all_button = QPushButton("Home All Axes")
-        home_all_button.setFont(QFont("Arial", 10, QFont.Bold))
+        home_all_button = QPushButton("Home All Axes", self)
+        home_all_button.setFont(FONT_ARIAL_10_BOLD)
         home_all_button.clicked.connect(self.homeAll)
-        home_all_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                border-radius: 6px;
-                color: white;
-                padding: 8px 16px;
-                min-width: 120px;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        home_all_button.setProperty("role", "action")
         
         control_layout = QHBoxLayout()
         control_layout.addStretch()
@@ -154,89 +296,89 @@ class MockHomingManager(QWidget):
         control_layout.addStretch()
         
         layout.addLayout(control_layout)
-        self.setLayout(layout)
         
     def homeAll(self):
         """Home all axes for demo"""
-        self.x_badge.updateStatus(True)
-        self.y_badge.updateStatus(True)
-        self.z_badge.updateStatus(True)
-        QMessageBox.information(self, "Homing", "All axes homed successfully!")
+        self._queueStatus(self.x_badge, True)
+        self._queueStatus(self.y_badge, True)
+        self._queueStatus(self.z_badge, True)
+        Toast.instance().show_message(self, "All axes homed successfully!")
+
+    def _queueStatus(self, badge, is_homed):
+        """Record a badge update; all pending updates are applied in one pass"""
+        if not self._pending:
+            QTimer.singleShot(0, self._applyPending)
+        self._pending[badge] = is_homed
+        
+    def _applyPending(self):
+        """Apply the queued badge updates"""
+        pending, self._pending = self._pending, {}
+        for badge, is_homed in pending.items():
+            badge.updateStatus(is_homed)
 
 class MockSpindleWarmup(QWidget):
     """Mock spindle warmup widget"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.setupUI()
         
     def setupUI(self):
         """Set up the UI"""
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(self)
         
         # Title
-        title_label = QLabel("🔄 Spindle Warmup")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label = QLabel(TITLE_WARMUP, self)
+        title_label.setFont(FONT_ARIAL_14_BOLD)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: #2196F3; padding: 5px;")
+        title_label.setStyleSheet(_QSS_TITLE_ACCENT)
         layout.addWidget(title_label)
         
         # Warmup selection
-        selection_frame = QFrame()
+        selection_frame = QFrame(self)
         selection_frame.setFrameStyle(QFrame.Box)
-        selection_layout = QVBoxLayout()
+        selection_layout = QVBoxLayout(selection_frame)
         
-        selection_layout.addWidget(QLabel("Select Warmup Program:"))
+        selection_layout.addWidget(QLabel("Select Warmup Program:", selection_frame))
         
-        self.warmup_combo = QComboBox()
+        self.warmup_combo = QComboBox(selection_frame)
         self.warmup_combo.addItems([
             "Quick Warmup (2 min)",
             "Standard Warmup (5 min)",
             "Thorough Warmup (10 min)"
         ])
-        self.warmup_combo.setStyleSheet("padding: 5px;")
+        self.warmup_combo.setStyleSheet(_QSS_COMBO)
         selection_layout.addWidget(self.warmup_combo)
         
         # Description
-        self.description_label = QLabel("Fast warmup for light operations")
+        self.description_label = QLabel("Fast warmup for light operations", selection_frame)
         self.description_label.setWordWrap(True)
-        self.description_label.setStyleSheet("color: #666; padding: 5px;")
+        self.description_label.setStyleSheet(_QSS_MUTED)
         selection_layout.addWidget(self.description_label)
         
-        selection_frame.setLayout(selection_layout)
         layout.addWidget(selection_frame)
         
         # Hours display
-        hours_frame = QFrame()
+        hours_frame = QFrame(self)
         hours_frame.setFrameStyle(QFrame.Box)
-        hours_layout = QVBoxLayout()
+        hours_layout = QVBoxLayout(hours_frame)
         
-        hours_title = QLabel("📊 Spindle Hours")
-        hours_title.setFont(QFont("Arial", 11, QFont.Bold))
+        hours_title = QLabel("📊 Spindle Hours", hours_frame)
+        hours_title.setFont(FONT_ARIAL_11_BOLD)
         hours_layout.addWidget(hours_title)
         
-        hours_layout.addWidget(QLabel("Total Hours: 247.3"))
-        hours_layout.addWidget(QLabel("Session Hours: 2.1"))
-        hours_layout.addWidget(QLabel("Last Warmup: 2024-01-15 09:30"))
+        hours_layout.addWidget(QLabel("Total Hours: 247.3\n"
+                                      "Session Hours: 2.1\n"
+                                      "Last Warmup: 2024-01-15 09:30",
+                                      hours_frame))
         
-        hours_frame.setLayout(hours_layout)
         layout.addWidget(hours_frame)
         
         # Warmup button
-        warmup_button = QPushButton("Start Warmup")
-        warmup_button.setFont(QFont("Arial", 11, QFont.Bold))
+        warmup_button = QPushButton("Start Warmup", self)
+        warmup_button.setFont(FONT_ARIAL_11_BOLD)
         warmup_button.clicked.connect(self.startWarmup)
-        warmup_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                border-radius: 6px;
-                color: white;
-                padding: 10px 20px;
-                min-width: 120px;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        warmup_button.setProperty("role", "action-large")
         
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -244,119 +386,71 @@ class MockSpindleWarmup(QWidget):
         
         layout.addLayout(button_layout)
         layout.addStretch()
-        self.setLayout(layout)
         
     def startWarmup(self):
         """Start warmup demo"""
-        QMessageBox.information(self, "Warmup", "Warmup sequence started!\n\nThis would normally run the selected RPM ladder sequence.")
+        Toast.instance().show_message(self, "Warmup sequence started!\n\nThis would normally run the selected RPM ladder sequence.")
 
 class MockMaintenanceWidget(QWidget):
     """Mock maintenance widget"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.setupUI()
         
     def setupUI(self):
         """Set up the UI"""
-        layout = QVBoxLayout()
-        
-        # Title with status
-        title_layout = QHBoxLayout()
-        
-        title_label = QLabel("🔧 Maintenance")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
-        title_layout.addWidget(title_label)
+        layout = QVBoxLayout(self)
         
-        status_indicator = QLabel("●")
-        status_indicator.setFont(QFont("Arial", 16))
-        status_indicator.setStyleSheet("color: #ff9800;")  # Orange - some issues
-        title_layout.addWidget(status_indicator)
-        
-        title_layout.addStretch()
-        layout.addLayout(title_layout)
+        # Title with status dot, orange - some issues
+        title_label = QLabel(_MAINTENANCE_TITLE_HTML, self)
+        title_label.setTextFormat(Qt.RichText)
+        title_label.setFont(FONT_ARIAL_14_BOLD)
+        layout.addWidget(title_label)
         
         # Summary
-        summary_frame = QFrame()
+        summary_frame = QFrame(self)
         summary_frame.setFrameStyle(QFrame.Box)
-        summary_frame.setStyleSheet("""
-            QFrame {
-                background-color: #fff3e0;
-                border: 2px solid #ff9800;
-                border-radius: 6px;
-                padding: 5px;
-            }
-        """)
-        
-        summary_layout = QVBoxLayout()
-        summary_label = QLabel("🔔 2 maintenance task(s) due soon")
+        summary_frame.setProperty("role", "warning-panel")
+        
+        summary_layout = QVBoxLayout(summary_frame)
+        summary_label = QLabel("🔔 2 maintenance task(s) due soon", summary_frame)
         summary_label.setAlignment(Qt.AlignCenter)
         summary_label.setWordWrap(True)
         summary_layout.addWidget(summary_label)
-        summary_frame.setLayout(summary_layout)
         
         layout.addWidget(summary_frame)
         
         # Sample maintenance task
-        task_frame = QFrame()
+        task_frame = QFrame(self)
         task_frame.setFrameStyle(QFrame.Box)
-        task_frame.setStyleSheet("""
-            QFrame {
-                background-color: #fff3e0;
-                border: 2px solid #ff9800;
-                border-radius: 8px;
-                padding: 5px;
-            }
-        """)
+        task_frame.setProperty("role", "warning-panel")
         
-        task_layout = QVBoxLayout()
+        task_layout = QVBoxLayout(task_frame)
         
         # Task header
-        task_title = QLabel("Spindle Lubrication - HIGH")
-        task_title.setFont(QFont("Arial", 11, QFont.Bold))
+        task_title = QLabel("Spindle Lubrication - HIGH", task_frame)
+        task_title.setFont(FONT_ARIAL_11_BOLD)
         task_layout.addWidget(task_title)
         
-        task_desc = QLabel("Check and refill spindle lubrication system")
-        task_desc.setStyleSheet("color: #666; margin: 3px;")
-        task_layout.addWidget(task_desc)
-        
-        task_due = QLabel("Due in 8.3 hours")
-        task_due.setStyleSheet("color: #666; margin: 3px;")
-        task_layout.addWidget(task_due)
+        task_details = QLabel("Check and refill spindle lubrication system\n"
+                              "Due in 8.3 hours", task_frame)
+        task_details.setStyleSheet(_QSS_MUTED_DETAIL)
+        task_layout.addWidget(task_details)
         
         # Buttons
         button_layout = QHBoxLayout()
         
-        snooze_combo = QComboBox()
+        snooze_combo = QComboBox(task_frame)
         snooze_combo.addItems(["Snooze 1h", "Snooze 8h", "Snooze 24h"])
-        snooze_combo.setStyleSheet("padding: 2px; font-size: 8px;")
-        
-        snooze_button = QPushButton("Snooze")
-        snooze_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff9800;
-                border: none;
-                border-radius: 3px;
-                color: white;
-                padding: 4px 8px;
-                font-size: 9px;
-            }
-            QPushButton:hover { background-color: #f57c00; }
-        """)
-        
-        complete_button = QPushButton("Mark Complete")
+        snooze_combo.setStyleSheet(_QSS_COMBO_SMALL)
+        
+        snooze_button = QPushButton("Snooze", task_frame)
+        snooze_button.setProperty("role", "task-snooze")
+        
+        complete_button = QPushButton("Mark Complete", task_frame)
         complete_button.clicked.connect(self.completeTask)
-        complete_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                border-radius: 3px;
-                color: white;
-                padding: 4px 8px;
-                font-size: 9px;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        complete_button.setProperty("role", "task-complete")
         
         button_layout.addWidget(snooze_combo)
         button_layout.addWidget(snooze_button)
@@ -364,24 +458,13 @@ class MockMaintenanceWidget(QWidget):
         button_layout.addWidget(complete_button)
         
         task_layout.addLayout(button_layout)
-        task_frame.setLayout(task_layout)
         
         layout.addWidget(task_frame)
         
         # View all button
-        view_all_button = QPushButton("View All Tasks")
+        view_all_button = QPushButton("View All Tasks", self)
         view_all_button.clicked.connect(self.viewAllTasks)
-        view_all_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                border: none;
-                border-radius: 4px;
-                color: white;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #1976D2; }
-        """)
+        view_all_button.setProperty("role", "info")
         
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -389,92 +472,63 @@ class MockMaintenanceWidget(QWidget):
         layout.addLayout(button_layout)
         
         layout.addStretch()
-        self.setLayout(layout)
         
     def completeTask(self):
         """Complete task demo"""
-        QMessageBox.information(self, "Task Complete", "Maintenance task marked as complete!\n\nCounter has been reset.")
+        Toast.instance().show_message(self, "Maintenance task marked as complete!\n\nCounter has been reset.")
         
     def viewAllTasks(self):
         """View all tasks demo"""
-        QMessageBox.information(self, "All Tasks", "This would show the complete maintenance management dialog.")
+        Toast.instance().show_message(self, "This would show the complete maintenance management dialog.")
 
 class MockLimitOverride(QWidget):
     """Mock limit override widget"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.setupUI()
         
     def setupUI(self):
         """Set up the UI"""
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(self)
         
         # Normally hidden, but show for demo
-        status_frame = QFrame()
+        status_frame = QFrame(self)
         status_frame.setFrameStyle(QFrame.Box)
-        status_frame.setStyleSheet("""
-            QFrame {
-                background-color: #fff3e0;
-                border: 2px solid #ff9800;
-                border-radius: 8px;
-                padding: 5px;
-            }
-        """)
-        
-        status_layout = QVBoxLayout()
-        
-        status_title = QLabel("Soft Limit Override Active")
-        status_title.setFont(QFont("Arial", 12, QFont.Bold))
+        status_frame.setProperty("role", "warning-panel")
+        
+        status_layout = QVBoxLayout(status_frame)
+        
+        status_title = QLabel("Soft Limit Override Active", status_frame)
+        status_title.setFont(FONT_ARIAL_12_BOLD)
         status_title.setAlignment(Qt.AlignCenter)
-        status_title.setStyleSheet("color: #ff6b35; padding: 5px;")
+        status_title.setStyleSheet(_QSS_WARNING_TITLE)
         status_layout.addWidget(status_title)
         
-        time_label = QLabel("Time remaining: 3:42")
+        time_label = QLabel("Time remaining: 3:42", status_frame)
         time_label.setAlignment(Qt.AlignCenter)
-        time_label.setFont(QFont("Arial", 10))
+        time_label.setFont(FONT_ARIAL_10)
         status_layout.addWidget(time_label)
         
-        reason_label = QLabel("Reason: Machine Recovery - Tool change required")
+        reason_label = QLabel("Reason: Machine Recovery - Tool change required", status_frame)
         reason_label.setAlignment(Qt.AlignCenter)
         reason_label.setWordWrap(True)
-        reason_label.setFont(QFont("Arial", 9))
-        reason_label.setStyleSheet("color: #666; padding: 5px;")
+        reason_label.setFont(FONT_ARIAL_9)
+        reason_label.setStyleSheet(_QSS_MUTED)
         status_layout.addWidget(reason_label)
         
         # Revert button
-        revert_button = QPushButton("Revert to Normal Limits")
+        revert_button = QPushButton("Revert to Normal Limits", status_frame)
         revert_button.clicked.connect(self.revertOverride)
-        revert_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                border-radius: 4px;
-                color: white;
-                padding: 6px 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        revert_button.setProperty("role", "confirm")
         status_layout.addWidget(revert_button)
         
-        status_frame.setLayout(status_layout)
         layout.addWidget(status_frame)
         
         # Trigger button for demo
-        trigger_button = QPushButton("Simulate Limit Trigger")
+        trigger_button = QPushButton("Simulate Limit Trigger", self)
         trigger_button.clicked.connect(self.triggerLimit)
-        trigger_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                border: none;
-                border-radius: 4px;
-                color: white;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #da190b; }
-        """)
+        trigger_button.setProperty("role", "danger")
         
         demo_layout = QHBoxLayout()
         demo_layout.addStretch()
@@ -482,15 +536,14 @@ class MockLimitOverride(QWidget):
         layout.addLayout(demo_layout)
         
         layout.addStretch()
-        self.setLayout(layout)
         
     def revertOverride(self):
         """Revert override demo"""
-        QMessageBox.information(self, "Override Reverted", "Soft limit override has been reverted.\n\nNormal limits are now active.")
+        Toast.instance().show_message(self, "Soft limit override has been reverted.\n\nNormal limits are now active.")
         
     def triggerLimit(self):
         """Trigger limit demo"""
-        QMessageBox.warning(self, "Limit Triggered", "⚠️ SOFT LIMIT TRIGGERED ⚠️\n\nThis would normally show the override dialog with countdown.")
+        Toast.instance().show_message(self, "⚠️ SOFT LIMIT TRIGGERED ⚠️\n\nThis would normally show the override dialog with countdown.")
 
 class Phase7DemoWindow(QMainWindow):
     """Main demo window"""
@@ -501,6 +554,10 @@ class Phase7DemoWindow(QMainWindow):
         self.setWindowTitle("Phase 7 Demo - Safety, Homing, Limits, Overrides & Warmup")
         self.setGeometry(100, 100, 1000, 700)
         
+        # Build the shared notification toast up front so the first
+        # handler call does not pay for it
+        Toast.instance()
+        
         # Create central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -517,81 +574,87 @@ class Phase7DemoWindow(QMainWindow):
         integrated_layout = QVBoxLayout()
         
         # Title
-        title_label = QLabel("🛡️ Phase 7 - Safety & Maintenance")
-        title_label.setFont(QFont("Arial", 16, QFont.Bold))
-        title_label.setStyleSheet("color: #2196F3; padding: 10px;")
+        title_label = QLabel(TITLE_PHASE7)
+        title_label.setFont(FONT_ARIAL_16_BOLD)
+        title_label.setStyleSheet(_QSS_HEADER_ACCENT)
         title_label.setAlignment(Qt.AlignCenter)
         integrated_layout.addWidget(title_label)
         
-        # Top row: Homing and Limits
-        top_row = QHBoxLayout()
-        
-        homing_frame = QFrame()
-        homing_frame.setFrameStyle(QFrame.Box)
-        homing_layout = QVBoxLayout()
-        homing_layout.addWidget(MockHomingManager())
-        homing_frame.setLayout(homing_layout)
-        top_row.addWidget(homing_frame)
-        
-        limit_frame = QFrame()
-        limit_frame.setFrameStyle(QFrame.Box)
-        limit_layout = QVBoxLayout()
-        limit_layout.addWidget(MockLimitOverride())
-        limit_frame.setLayout(limit_layout)
-        top_row.addWidget(limit_frame)
-        
-        integrated_layout.addLayout(top_row)
-        
-        # Bottom row: Warmup and Maintenance
-        bottom_row = QHBoxLayout()
-        
-        warmup_frame = QFrame()
-        warmup_frame.setFrameStyle(QFrame.Box)
-        warmup_layout = QVBoxLayout()
-        warmup_layout.addWidget(MockSpindleWarmup())
-        warmup_frame.setLayout(warmup_layout)
-        bottom_row.addWidget(warmup_frame)
-        
-        maintenance_frame = QFrame()
-        maintenance_frame.setFrameStyle(QFrame.Box)
-        maintenance_layout = QVBoxLayout()
-        maintenance_layout.addWidget(MockMaintenanceWidget())
-        maintenance_frame.setLayout(maintenance_layout)
-        bottom_row.addWidget(maintenance_frame)
-        
-        integrated_layout.addLayout(bottom_row)
+        # Each safety widget is built once and shared between tabs: it sits
+        # in the grid on the integrated panel and moves onto its own tab
+        # while that tab is selected
+        self._homing = MockHomingManager()
+        self._limit = MockLimitOverride()
+        self._warmup = MockSpindleWarmup()
+        self._maint = MockMaintenanceWidget()
+        
+        # Homing and Limits on top, Warmup and Maintenance below
+        self._grid = QGridLayout()
+        self._grid_cells = ((self._homing, 0, 0), (self._limit, 0, 1),
+                            (self._warmup, 1, 0), (self._maint, 1, 1))
+        for widget, row, column in self._grid_cells:
+            self._grid.addWidget(widget, row, column)
+        integrated_layout.addLayout(self._grid)
         integrated_panel.setLayout(integrated_layout)
         
-        tab_widget.addTab(integrated_panel, "🛡️ Integrated Safety Panel")
+        tab_widget.addTab(integrated_panel, TITLE_INTEGRATED)
         
-        # Individual tabs
-        tab_widget.addTab(MockHomingManager(), "🏠 Homing Manager")
-        tab_widget.addTab(MockLimitOverride(), "⚠️ Limit Override")
-        tab_widget.addTab(MockSpindleWarmup(), "🔄 Spindle Warmup")
-        tab_widget.addTab(MockMaintenanceWidget(), "🔧 Maintenance")
+        # Individual tabs are empty pages that borrow the shared widget
+        self._tab_panels = [None, self._homing, self._limit,
+                            self._warmup, self._maint]
+        for label in (TITLE_HOMING, TITLE_LIMITS,
+                      TITLE_WARMUP, TITLE_MAINTENANCE):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            tab_widget.addTab(page, label)
+        tab_widget.currentChanged.connect(self._showPanel)
+        self.tab_widget = tab_widget
         
         layout.addWidget(tab_widget)
+        
+    def _showPanel(self, index):
+        """Move the shared safety widgets onto the selected tab"""
+        if index == 0:
+            for widget, row, column in self._grid_cells:
+                self._grid.addWidget(widget, row, column)
+        elif index > 0:
+            # addWidget() takes the widget out of the grid and reparents it
+            self.tab_widget.widget(index).layout().addWidget(self._tab_panels[index])
+
+_BANNER_LINES = (
+    "Phase 7 UI Demo",
+    "===============",
+    "This demonstrates the visual interface for Phase 7 features:",
+    "• Homing Manager with per-axis status badges",
+    "• Soft Limit Override with active status display",
+    "• Spindle Warmup with program selection",
+    "• Maintenance Reminders with task management",
+    "",
+    "Interactive elements:",
+    "- Click homing badges to toggle status",
+    "- Try warmup and maintenance buttons",
+    "- Test limit override simulation",
+)
 
 def main():
     """Run the demo"""
     app = QApplication(sys.argv)
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings, True)
+    
+    # Style, stylesheet and effects are all settled before any widget
+    # exists, so the window is polished once
     app.setStyle('Fusion')
+    app.setStyleSheet(GLOBAL_QSS)
+    app.setEffectEnabled(Qt.UI_AnimateCombo, False)
+    app.setEffectEnabled(Qt.UI_AnimateTooltip, False)
     
     demo_window = Phase7DemoWindow()
-    demo_window.show()
     
-    print("Phase 7 UI Demo")
-    print("===============")
-    print("This demonstrates the visual interface for Phase 7 features:")
-    print("• Homing Manager with per-axis status badges")
-    print("• Soft Limit Override with active status display")
-    print("• Spindle Warmup with program selection")
-    print("• Maintenance Reminders with task management")
-    print()
-    print("Interactive elements:")
-    print("- Click homing badges to toggle status")
-    print("- Try warmup and maintenance buttons")
-    print("- Test limit override simulation")
+    # Finish the console output before the first show() and paint
+    sys.stdout.write("\n".join(_BANNER_LINES) + "\n")
+    sys.stdout.flush()
+    
+    demo_window.show()
     
     return app.exec_()
 
@@ -12,49 +12,89 @@ Demonstrates the Phase 9 widgets functionality including:
 
 import sys
 import os
+import itertools
+import tempfile
+from datetime import datetime
 from pathlib import Path
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 try:
-    from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, 
+    from qtpy.QtWidgets import (QApplication, QMainWindow, QTabWidget,
                                 QVBoxLayout, QWidget, QLabel, QMessageBox,
-                                QHBoxLayout, QPushButton, QSplitter)
-    from PyQt5.QtCore import pyqtSlot, QTimer
-    from PyQt5.QtGui import QFont
-    PyQt5_available = True
+                                QHBoxLayout, QPushButton)
+    from qtpy.QtCore import (Qt, Slot, Signal, QObject, QRunnable,
+                             QThreadPool, QTimer)
+    from qtpy.QtGui import QFont
 except ImportError:
-    try:
-        from PyQt4.QtGui import (QApplication, QMainWindow, QTabWidget,
-                                QVBoxLayout, QWidget, QLabel, QMessageBox,
-                                QHBoxLayout, QPushButton, QFont)
-        from PyQt4.QtCore import pyqtSlot, QTimer
-        PyQt5_available = False
-        
-        # Create QSplitter stub for PyQt4
-        class QSplitter(QWidget):
-            def __init__(self, orientation=None):
-                super(QSplitter, self).__init__()
-                self.layout = QHBoxLayout()
-                self.setLayout(self.layout)
-            def addWidget(self, widget):
-                self.layout.addWidget(widget)
-    except ImportError:
-        print("Error: Neither PyQt5 nor PyQt4 is available")
-        print("This demo requires PyQt5 or PyQt4 to run")
-        sys.exit(1)
+    print("Error: No Qt binding is available through qtpy")
+    print("This demo requires qtpy with PyQt5 (or another supported binding)")
+    sys.exit(1)
 
-# Import Phase 9 widgets
-try:
-    from widgets.profile_manager.profile_manager import ProfileManager
-    from widgets.settings_manager.settings_manager import SettingsManager  
-    from widgets.network_manager.network_manager import NetworkManager
-    from widgets.backup_restore.backup_restore import BackupRestore
-    widgets_available = True
-except ImportError as e:
-    print(f"Warning: Could not import Phase 9 widgets: {e}")
-    widgets_available = False
+# Header font and panel stylesheets, built once per process
+_HEADER_FONT = QFont()
+_HEADER_FONT.setPointSize(16)
+_HEADER_FONT.setBold(True)
+
+_HEADER_CSS = "padding: 16px; background: #f0f0f0; border-radius: 8px; margin-bottom: 16px;"
+_INFO_CSS = "padding: 12px; background: #e8f4f8; border-radius: 6px; margin-bottom: 16px;"
+_ERROR_CSS = "padding: 20px; background: #ffebee; border-radius: 8px; color: #c62828;"
+_STATUS_CSS = "padding: 8px; background: #f5f5f5; border-top: 1px solid #ddd;"
+
+_INFO_TEXT = """\
+This demo showcases the Phase 9 functionality:
+
+• Profile Manager: Create, clone, switch, and delete LinuxCNC machine profiles
+• Settings Manager: Configure units, UI scale, theme, and touchscreen options  
+• Network Manager: Manage SMB/NFS network share mounting with credentials
+• Backup/Restore: Complete backup and restore system with factory reset capability
+
+Each tab demonstrates a different aspect of the Phase 9 implementation."""
+
+_WELCOME_TEXT = (
+    "Welcome to the Phase 9 Demo!\n\n"
+    "This demonstrates the Settings, Profiles & Network functionality.\n\n"
+    "• Profile Manager: Manage LinuxCNC machine configurations\n"
+    "• Settings Manager: Configure application preferences\n" 
+    "• Network Manager: Mount SMB/NFS network shares\n"
+    "• Backup/Restore: Complete backup and restore system\n\n"
+    "Use the demo buttons to see the functionality in action."
+)
+
+# Demo backup file name, expanded with strftime()
+_BACKUP_FMT = "pb_touch_demo_backup_%Y%m%d_%H%M%S.zip"
+
+# Tab order in the demo window
+_PROFILE_TAB, _SETTINGS_TAB, _NETWORK_TAB, _BACKUP_TAB = range(4)
+_TAB_TITLES = ("Profile Manager", "Settings Manager", "Network Manager",
+               "Backup & Restore")
+
+
+class IoWorkerSignals(QObject):
+    """Signals for IoWorker, which as a QRunnable cannot emit its own"""
+    
+    done = Signal(object)   # return value of the call
+    failed = Signal(str)    # error message
+    
+    
+class IoWorker(QRunnable):
+    """Run one blocking call on a thread pool thread"""
+    
+    def __init__(self, fn, *args):
+        super(IoWorker, self).__init__()
+        self._fn = fn
+        self._args = args
+        self.signals = IoWorkerSignals()
+        
+    def run(self):
+        """Call the function and report the outcome"""
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.done.emit(result)
 
 
 class Phase9Demo(QMainWindow):
@@ -62,6 +102,11 @@ class Phase9Demo(QMainWindow):
     
     def __init__(self):
         super(Phase9Demo, self).__init__()
+        self._demo_counter = itertools.count(1)  # demo profile name suffixes
+        
+        # Blocking file writes run here, one at a time and in order
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
         self.init_ui()
         
     def init_ui(self):
@@ -77,186 +122,277 @@ class Phase9Demo(QMainWindow):
         
         # Header
         header = QLabel("Phase 9 - Settings, Profiles & Network Demo")
-        header_font = QFont()
-        header_font.setPointSize(16)
-        header_font.setBold(True)
-        header.setFont(header_font)
-        header.setStyleSheet("padding: 16px; background: #f0f0f0; border-radius: 8px; margin-bottom: 16px;")
+        header.setFont(_HEADER_FONT)
+        header.setStyleSheet(_HEADER_CSS)
         layout.addWidget(header)
         
         # Info panel
-        info_text = """
-This demo showcases the Phase 9 functionality:
-
-• Profile Manager: Create, clone, switch, and delete LinuxCNC machine profiles
-• Settings Manager: Configure units, UI scale, theme, and touchscreen options  
-• Network Manager: Manage SMB/NFS network share mounting with credentials
-• Backup/Restore: Complete backup and restore system with factory reset capability
-
-Each tab demonstrates a different aspect of the Phase 9 implementation.
-        """
-        
-        info_label = QLabel(info_text.strip())
-        info_label.setStyleSheet("padding: 12px; background: #e8f4f8; border-radius: 6px; margin-bottom: 16px;")
+        info_label = QLabel(_INFO_TEXT)
+        info_label.setStyleSheet(_INFO_CSS)
         layout.addWidget(info_label)
         
-        if widgets_available:
-            # Create tab widget with Phase 9 widgets
-            self.tab_widget = QTabWidget()
-            
-            # Profile Manager tab
-            self.profile_manager = ProfileManager()
-            self.profile_manager.profile_switched.connect(self.on_profile_switched)
-            self.profile_manager.profile_created.connect(self.on_profile_created)
-            self.profile_manager.profile_deleted.connect(self.on_profile_deleted)
-            self.tab_widget.addTab(self.profile_manager, "Profile Manager")
-            
-            # Settings Manager tab
-            self.settings_manager = SettingsManager()
-            self.settings_manager.settings_changed.connect(self.on_setting_changed)
-            self.settings_manager.theme_changed.connect(self.on_theme_changed)
-            self.settings_manager.units_changed.connect(self.on_units_changed)
-            self.tab_widget.addTab(self.settings_manager, "Settings Manager")
-            
-            # Network Manager tab
-            self.network_manager = NetworkManager()
-            self.network_manager.share_mounted.connect(self.on_share_mounted)
-            self.network_manager.share_unmounted.connect(self.on_share_unmounted)
-            self.network_manager.shares_changed.connect(self.on_shares_changed)
-            self.tab_widget.addTab(self.network_manager, "Network Manager")
-            
-            # Backup/Restore tab
-            self.backup_restore = BackupRestore()
-            self.backup_restore.backup_completed.connect(self.on_backup_completed)
-            self.backup_restore.restore_completed.connect(self.on_restore_completed)
-            self.backup_restore.factory_reset_completed.connect(self.on_factory_reset_completed)
-            self.tab_widget.addTab(self.backup_restore, "Backup & Restore")
-            
-            layout.addWidget(self.tab_widget)
-            
-            # Demo controls
-            demo_layout = QHBoxLayout()
-            
-            self.demo_profile_btn = QPushButton("Create Demo Profile")
-            self.demo_profile_btn.clicked.connect(self.create_demo_profile)
-            demo_layout.addWidget(self.demo_profile_btn)
-            
-            self.demo_settings_btn = QPushButton("Apply Demo Settings")
-            self.demo_settings_btn.clicked.connect(self.apply_demo_settings)
-            demo_layout.addWidget(self.demo_settings_btn)
-            
-            self.demo_share_btn = QPushButton("Add Demo Network Share")
-            self.demo_share_btn.clicked.connect(self.add_demo_share)
-            demo_layout.addWidget(self.demo_share_btn)
-            
-            demo_layout.addStretch()
-            
-            self.demo_backup_btn = QPushButton("Create Demo Backup")
-            self.demo_backup_btn.clicked.connect(self.create_demo_backup)
-            demo_layout.addWidget(self.demo_backup_btn)
-            
-            layout.addLayout(demo_layout)
+        # Create tab widget with Phase 9 widgets. Each tab starts as an
+        # empty placeholder; the real widget (its import, and its profile,
+        # settings or shares I/O) is only built the first time it is needed.
+        self.tab_widget = QTabWidget()
+        self._unavailable_tabs = set()
+        self._factories = {
+            _PROFILE_TAB: self._create_profile_manager,
+            _SETTINGS_TAB: self._create_settings_manager,
+            _NETWORK_TAB: self._create_network_manager,
+            _BACKUP_TAB: self._create_backup_restore,
+        }
+        for title in _TAB_TITLES:
+            self.tab_widget.addTab(QWidget(), title)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+        
+        # Populate the initially visible tab once the window is shown
+        QTimer.singleShot(0, self._materialize_current_tab)
+        
+        layout.addWidget(self.tab_widget)
+        
+        # Demo controls
+        demo_layout = QHBoxLayout()
+        
+        self.demo_profile_btn = QPushButton("Create Demo Profile")
+        self.demo_profile_btn.clicked.connect(self.create_demo_profile)
+        demo_layout.addWidget(self.demo_profile_btn)
+        
+        self.demo_settings_btn = QPushButton("Apply Demo Settings")
+        self.demo_settings_btn.clicked.connect(self.apply_demo_settings)
+        demo_layout.addWidget(self.demo_settings_btn)
+        
+        self.demo_share_btn = QPushButton("Add Demo Network Share")
+        self.demo_share_btn.clicked.connect(self.add_demo_share)
+        demo_layout.addWidget(self.demo_share_btn)
+        
+        demo_layout.addStretch()
+        
+        self.demo_backup_btn = QPushButton("Create Demo Backup")
+        self.demo_backup_btn.clicked.connect(self.create_demo_backup)
+        demo_layout.addWidget(self.demo_backup_btn)
+        
+        layout.addLayout(demo_layout)
+        
+        # Status bar
+        self.status_label = QLabel("Ready - Phase 9 Demo Loaded")
+        self.status_label.setStyleSheet(_STATUS_CSS)
+        layout.addWidget(self.status_label)
+        
+        # Status updates arriving in a burst are coalesced into one repaint
+        self._status_pending = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        central_widget.setLayout(layout)
+        
+    # Widget signal -> demo slot, keyed by the attribute holding the widget
+    _SIGNAL_WIRING = {
+        "profile_manager": (
+            ("profile_switched", "on_profile_switched"),
+            ("profile_created", "on_profile_created"),
+            ("profile_deleted", "on_profile_deleted"),
+        ),
+        "settings_manager": (
+            ("settings_changed", "on_setting_changed"),
+            ("theme_changed", "on_theme_changed"),
+            ("units_changed", "on_units_changed"),
+        ),
+        "network_manager": (
+            ("share_mounted", "on_share_mounted"),
+            ("share_unmounted", "on_share_unmounted"),
+            ("shares_changed", "on_shares_changed"),
+        ),
+        "backup_restore": (
+            ("backup_completed", "on_backup_completed"),
+            ("restore_completed", "on_restore_completed"),
+            ("factory_reset_completed", "on_factory_reset_completed"),
+        ),
+    }
+    
+    # Signals reporting the end of slow mount or backup work; their slots
+    # run from the event loop instead of inside the emitter's call stack
+    _QUEUED_SIGNALS = frozenset((
+        "share_mounted", "share_unmounted",
+        "backup_completed", "restore_completed", "factory_reset_completed",
+    ))
+    
+    # Lazy tab construction
+    def _wire(self, attr):
+        """Connect the signals of the widget stored in attr and return it"""
+        widget = getattr(self, attr)
+        for signal, slot in self._SIGNAL_WIRING[attr]:
+            if signal in self._QUEUED_SIGNALS:
+                getattr(widget, signal).connect(getattr(self, slot), Qt.QueuedConnection)
+            else:
+                getattr(widget, signal).connect(getattr(self, slot))
+        return widget
+        
+    def _create_profile_manager(self):
+        """Build the Profile Manager tab"""
+        from widgets.profile_manager.profile_manager import ProfileManager
+        self.profile_manager = ProfileManager()
+        return self._wire("profile_manager")
+        
+    def _create_settings_manager(self):
+        """Build the Settings Manager tab"""
+        from widgets.settings_manager.settings_manager import SettingsManager
+        self.settings_manager = SettingsManager()
+        return self._wire("settings_manager")
+        
+    def _create_network_manager(self):
+        """Build the Network Manager tab"""
+        from widgets.network_manager.network_manager import NetworkManager
+        self.network_manager = NetworkManager()
+        return self._wire("network_manager")
+        
+    def _create_backup_restore(self):
+        """Build the Backup & Restore tab"""
+        from widgets.backup_restore.backup_restore import BackupRestore
+        self.backup_restore = BackupRestore()
+        return self._wire("backup_restore")
+        
+    def _tab_ready(self, index):
+        """Build the tab at index if needed; False if its widget is unavailable"""
+        self._materialize_tab(index)
+        return index not in self._unavailable_tabs
+        
+    def _materialize_current_tab(self):
+        """Build whichever tab is currently visible"""
+        self._materialize_tab(self.tab_widget.currentIndex())
+        
+    @Slot(int)
+    def _materialize_tab(self, index):
+        """Replace a placeholder tab with its real widget, once"""
+        factory = self._factories.pop(index, None)
+        if factory is None:
+            return
             
-        else:
-            # Show error message if widgets not available
-            error_label = QLabel(
+        try:
+            widget = factory()
+        except ImportError as e:
+            print(f"Warning: Could not import Phase 9 widgets: {e}")
+            self._unavailable_tabs.add(index)
+            widget = QLabel(
                 "❌ Phase 9 widgets could not be imported.\n\n"
                 "This may be due to missing Qt dependencies.\n"
-                "The widgets are implemented and ready for integration."
+                "The widgets are implemented and ready for integration.\n\n"
+                f"{e}"
             )
-            error_label.setStyleSheet("padding: 20px; background: #ffebee; border-radius: 8px; color: #c62828;")
-            layout.addWidget(error_label)
+            widget.setStyleSheet(_ERROR_CSS)
             
-        # Status bar
-        self.status_label = QLabel("Ready - Phase 9 Demo Loaded")
-        self.status_label.setStyleSheet("padding: 8px; background: #f5f5f5; border-top: 1px solid #ddd;")
-        layout.addWidget(self.status_label)
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+        current = self.tab_widget.currentIndex()
         
-        central_widget.setLayout(layout)
+        # Swapping the page would otherwise re-enter via currentChanged
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setCurrentIndex(current)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
+    def _set_status(self, message):
+        """Queue a status bar message; only the latest one is shown"""
+        self._status_pending = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+            
+    def _flush_status(self):
+        """Show the most recent queued status message"""
+        self.status_label.setText(self._status_pending)
+        
+    def _show_info(self, title, text):
+        """Show a non-modal information box that deletes itself when closed"""
+        box = QMessageBox(QMessageBox.Information, title, text, QMessageBox.Ok, self)
+        box.setModal(False)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.show()
         
     # Profile Manager signal handlers
-    @pyqtSlot(str)
+    @Slot(str)
     def on_profile_switched(self, profile_name):
         """Handle profile switch"""
-        self.status_label.setText(f"Profile switched to: {profile_name}")
-        QMessageBox.information(self, "Profile Switched", 
-                               f"Successfully switched to profile: {profile_name}")
+        self._set_status(f"Profile switched to: {profile_name}")
         
-    @pyqtSlot(str) 
+    @Slot(str) 
     def on_profile_created(self, profile_name):
         """Handle profile creation"""
-        self.status_label.setText(f"Profile created: {profile_name}")
+        self._set_status(f"Profile created: {profile_name}")
         
-    @pyqtSlot(str)
+    @Slot(str)
     def on_profile_deleted(self, profile_name):
         """Handle profile deletion"""
-        self.status_label.setText(f"Profile deleted: {profile_name}")
+        self._set_status(f"Profile deleted: {profile_name}")
         
     # Settings Manager signal handlers
-    @pyqtSlot(str, object)
+    @Slot(str, object)
     def on_setting_changed(self, setting_name, value):
         """Handle setting change"""
-        self.status_label.setText(f"Setting changed: {setting_name} = {value}")
+        self._set_status(f"Setting changed: {setting_name} = {value}")
         
-    @pyqtSlot(str)
+    @Slot(str)
     def on_theme_changed(self, theme_name):
         """Handle theme change"""
-        self.status_label.setText(f"Theme changed to: {theme_name}")
+        self._set_status(f"Theme changed to: {theme_name}")
         
-    @pyqtSlot(str)
+    @Slot(str)
     def on_units_changed(self, units):
         """Handle units change"""
-        self.status_label.setText(f"Units changed to: {units}")
+        self._set_status(f"Units changed to: {units}")
         
     # Network Manager signal handlers
-    @pyqtSlot(str, str)
+    @Slot(str, str)
     def on_share_mounted(self, name, mount_point):
         """Handle share mounted"""
-        self.status_label.setText(f"Share mounted: {name} at {mount_point}")
-        QMessageBox.information(self, "Share Mounted",
-                               f"Network share '{name}' mounted successfully at:\n{mount_point}")
+        self._set_status(f"Share mounted: {name} at {mount_point}")
+        self._show_info("Share Mounted",
+                        f"Network share '{name}' mounted successfully at:\n{mount_point}")
         
-    @pyqtSlot(str)
+    @Slot(str)
     def on_share_unmounted(self, name):
         """Handle share unmounted"""
-        self.status_label.setText(f"Share unmounted: {name}")
+        self._set_status(f"Share unmounted: {name}")
         
-    @pyqtSlot()
+    @Slot()
     def on_shares_changed(self):
         """Handle shares configuration change"""
-        self.status_label.setText("Network shares configuration updated")
+        self._set_status("Network shares configuration updated")
         
     # Backup/Restore signal handlers
-    @pyqtSlot(str)
+    @Slot(str)
     def on_backup_completed(self, backup_path):
         """Handle backup completion"""
-        self.status_label.setText(f"Backup completed: {backup_path}")
-        QMessageBox.information(self, "Backup Completed",
-                               f"Backup created successfully:\n{backup_path}")
+        self._set_status(f"Backup completed: {backup_path}")
+        self._show_info("Backup Completed",
+                        f"Backup created successfully:\n{backup_path}")
         
-    @pyqtSlot()
+    @Slot()
     def on_restore_completed(self):
         """Handle restore completion"""
-        self.status_label.setText("Restore completed successfully")
-        QMessageBox.information(self, "Restore Completed",
-                               "Backup restored successfully!")
+        self._set_status("Restore completed successfully")
+        self._show_info("Restore Completed",
+                        "Backup restored successfully!")
         
-    @pyqtSlot()
+    @Slot()
     def on_factory_reset_completed(self):
         """Handle factory reset completion"""
-        self.status_label.setText("Factory reset completed")
-        QMessageBox.information(self, "Factory Reset",
-                               "Factory reset completed successfully!")
+        self._set_status("Factory reset completed")
+        self._show_info("Factory Reset",
+                        "Factory reset completed successfully!")
         
     # Demo functions
     def create_demo_profile(self):
         """Create a demo profile"""
-        if not widgets_available:
+        if not self._tab_ready(_PROFILE_TAB):
             return
             
         # Simulate profile creation
         demo_data = {
-            'name': f'Demo_Profile_{QTimer().remainingTime() % 1000}',
+            'name': f'Demo_Profile_{next(self._demo_counter)}',
             'description': 'Demo profile created for testing',
             'template': 'Basic Sim (3-axis mill)',
             'set_default': False,
@@ -264,15 +400,18 @@ Each tab demonstrates a different aspect of the Phase 9 implementation.
         }
         
         try:
-            self.profile_manager.create_profile_bundle(demo_data)
-            self.profile_manager.load_profiles()
-            self.status_label.setText(f"Demo profile created: {demo_data['name']}")
+            profile_path = self.profile_manager.create_profile_bundle(demo_data)
+            
+            # Add the one new row rather than rescanning the profiles directory
+            if not self.profile_manager.profile_list.findItems(demo_data['name'], Qt.MatchExactly):
+                self.profile_manager.add_profile_item(demo_data['name'], profile_path)
+            self._set_status(f"Demo profile created: {demo_data['name']}")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to create demo profile:\n{e}")
             
     def apply_demo_settings(self):
         """Apply demo settings"""
-        if not widgets_available:
+        if not self._tab_ready(_SETTINGS_TAB):
             return
             
         # Apply some demo settings
@@ -281,13 +420,13 @@ Each tab demonstrates a different aspect of the Phase 9 implementation.
             self.settings_manager.set_setting('scale_factor', 125)
             self.settings_manager.set_setting('theme', 'High Contrast')
             self.settings_manager.load_current_settings()
-            self.status_label.setText("Demo settings applied")
+            self._set_status("Demo settings applied")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to apply demo settings:\n{e}")
             
     def add_demo_share(self):
         """Add demo network share"""
-        if not widgets_available:
+        if not self._tab_ready(_NETWORK_TAB):
             return
             
         # Add a demo share configuration
@@ -301,31 +440,44 @@ Each tab demonstrates a different aspect of the Phase 9 implementation.
             'readonly': False
         }
         
-        try:
-            self.network_manager.shares['Demo_Share'] = demo_share
-            self.network_manager.save_shares()
-            self.network_manager.load_shares_list()
-            self.status_label.setText("Demo network share added")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to add demo share:\n{e}")
+        # Update the list straight away and write shares.json off the UI
+        # thread, from a snapshot so later edits can't race the write
+        self.network_manager.shares['Demo_Share'] = demo_share
+        self.network_manager.load_shares_list()
+        
+        worker = IoWorker(self.network_manager.write_shares,
+                          dict(self.network_manager.shares))
+        worker.signals.done.connect(self.on_demo_share_saved, Qt.QueuedConnection)
+        worker.signals.failed.connect(self.on_demo_share_failed, Qt.QueuedConnection)
+        self._io_pool.start(worker)
+        self._set_status("Saving demo network share...")
+        
+    @Slot(object)
+    def on_demo_share_saved(self, _result):
+        """Handle the demo share reaching disk"""
+        self._set_status("Demo network share added")
+        
+    @Slot(str)
+    def on_demo_share_failed(self, message):
+        """Handle a failed demo share write"""
+        self._set_status("Demo network share could not be saved")
+        QMessageBox.warning(self, "Error", f"Failed to add demo share:\n{message}")
             
+
     def create_demo_backup(self):
         """Create demo backup"""
-        if not widgets_available:
+        if not self._tab_ready(_BACKUP_TAB):
             return
             
         # Set up demo backup
-        import tempfile
-        from datetime import datetime
-        
-        demo_backup_path = Path(tempfile.gettempdir()) / f"pb_touch_demo_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        demo_backup_path = Path(tempfile.gettempdir()) / datetime.now().strftime(_BACKUP_FMT)
         
         try:
             self.backup_restore.backup_path_edit.setText(str(demo_backup_path))
             self.backup_restore.backup_profiles_check.setChecked(True)
             self.backup_restore.backup_settings_check.setChecked(True) 
             self.backup_restore.backup_network_check.setChecked(True)
-            self.status_label.setText("Demo backup configured - click 'Create Backup' to proceed")
+            self._set_status("Demo backup configured - click 'Create Backup' to proceed")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to setup demo backup:\n{e}")
 
@@ -343,17 +495,11 @@ def main():
     demo = Phase9Demo()
     demo.show()
     
-    # Show startup message
-    QTimer.singleShot(500, lambda: QMessageBox.information(
-        demo, "Phase 9 Demo",
-        "Welcome to the Phase 9 Demo!\n\n"
-        "This demonstrates the Settings, Profiles & Network functionality.\n\n"
-        "• Profile Manager: Manage LinuxCNC machine configurations\n"
-        "• Settings Manager: Configure application preferences\n" 
-        "• Network Manager: Mount SMB/NFS network shares\n"
-        "• Backup/Restore: Complete backup and restore system\n\n"
-        "Use the demo buttons to see the functionality in action."
-    ))
+    # Show startup message, non-modal so the window stays usable
+    welcome_box = QMessageBox(QMessageBox.Information, "Phase 9 Demo",
+                              _WELCOME_TEXT, QMessageBox.Ok, demo)
+    welcome_box.setModal(False)
+    QTimer.singleShot(500, welcome_box.show)
     
     return app.exec_()
 
@@ -363,10 +509,4 @@ if __name__ == "__main__":
     print("=" * 50)
     print()
     
-    if not widgets_available:
-        print("Warning: Phase 9 widgets could not be imported")
-        print("This may be due to Qt dependencies not being available")
-        print("The demo will show the UI structure but functionality will be limited")
-        print()
-    
     sys.exit(main())
\ No newline at end of file
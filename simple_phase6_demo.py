@@ -5,17 +5,31 @@ Shows the implemented functionality structure
 """
 
 import os
-import json
+import sys
 import tempfile
+from collections import Counter
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        """Serialize obj to indented JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        """Serialize obj to indented JSON bytes"""
+        return json.dumps(obj, indent=2).encode()
+
+# Metadata every newly discovered file starts with
+_METADATA_TEMPLATE = {"last_run": "Never", "run_count": 0}
+
 def demo_file_browser_logic():
     """Demonstrate file browser functionality"""
     print("=== File Browser Demo ===")
     
-    # Simulate file metadata management
-    metadata_cache = {}
-    
     # Mock file discovery
     demo_files = [
         ("test_program.ngc", 1024, datetime.now()),
@@ -34,13 +48,10 @@ def demo_file_browser_logic():
     for filename, size, modified in demo_files:
         size_str = f"{size} bytes" if size < 1024 else f"{size/1024:.1f} KB"
         print(f"  {filename:<20} {size_str:<10} {modified.strftime('%Y-%m-%d %H:%M')}")
-        
-        # Update metadata
-        file_path = f"/demo/path/{filename}"
-        metadata_cache[file_path] = {
-            "last_run": "Never",
-            "run_count": 0
-        }
+    
+    # Simulate file metadata management
+    metadata_cache = {f"/demo/path/{filename}": _METADATA_TEMPLATE.copy()
+                      for filename, _, _ in demo_files}
     
     print(f"\nMetadata cache entries: {len(metadata_cache)}")
     return metadata_cache
@@ -58,9 +69,6 @@ def demo_job_manager_logic():
         SKIPPED = "skipped"
         HELD = "held"
     
-    # Mock job queue
-    job_queue = []
-    
     # Add demo jobs
     demo_jobs = [
         {"file": "demo_facing.ngc", "name": "Facing Operation", "status": JobStatus.PENDING},
@@ -75,25 +83,27 @@ def demo_job_manager_logic():
     print("• Job history with status and duration")
     print()
     
-    print("Job Queue:")
-    for i, job in enumerate(demo_jobs):
-        job_queue.append(job)
-        print(f"  {i+1}. {job['name']:<20} ({job['status']})")
+    # Mock job queue
+    job_queue = list(demo_jobs)
+    
+    lines = ["Job Queue:"]
+    lines.extend(f"  {i}. {job['name']:<20} ({job['status']})"
+                 for i, job in enumerate(job_queue, 1))
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Simulate queue execution
-    print("\nSimulating queue execution:")
+    lines = ["\nSimulating queue execution:"]
     for job in job_queue:
         job['status'] = JobStatus.RUNNING
-        print(f"  Running: {job['name']}...")
+        lines.append(f"  Running: {job['name']}...")
         job['status'] = JobStatus.COMPLETED
-        print(f"  ✓ Completed: {job['name']}")
+        lines.append(f"  ✓ Completed: {job['name']}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Queue status summary
-    status_counts = {}
-    for job in job_queue:
-        status_counts[job['status']] = status_counts.get(job['status'], 0) + 1
+    status_counts = Counter(job['status'] for job in job_queue)
     
-    print(f"\nQueue Summary: {status_counts}")
+    print(f"\nQueue Summary: {dict(status_counts)}")
     return job_queue
 
 def demo_conversational_operations():
@@ -168,10 +178,13 @@ def demo_conversational_operations():
         }
     }
     
-    # Save JSON sidecar to temp file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(demo_operation, f, indent=2)
-        json_path = f.name
+    # Save JSON sidecar to temp file; the same bytes feed the preview below
+    blob = _dumps(demo_operation)
+    fd, json_path = tempfile.mkstemp(suffix='.json')
+    try:
+        os.write(fd, blob)
+    finally:
+        os.close(fd)
     
     print(f"JSON sidecar created: {json_path}")
     print("Features:")
@@ -182,7 +195,7 @@ def demo_conversational_operations():
     
     # Show sample JSON structure
     print("\nSample JSON structure:")
-    print(json.dumps(demo_operation, indent=2)[:500] + "...")
+    print(blob[:500].decode("utf-8", "ignore") + "...")
     
     # Clean up
     os.unlink(json_path)
@@ -9,9 +9,27 @@ a simple test environment for validating the touch theming system.
 
 import sys
 import os
+import importlib.util
+from contextlib import contextmanager
+
+
+@contextmanager
+def _probe_basic_on_path():
+    """Make probe_basic importable from this checkout for the duration of the block.
+
+    Nothing is added when probe_basic is already importable (installed, or
+    run from this directory), and the added entry is removed afterwards.
+    """
+    if importlib.util.find_spec('probe_basic') is not None:
+        yield
+        return
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, src_dir)
+    try:
+        yield
+    finally:
+        sys.path.remove(src_dir)
 
-# Add the source path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 try:
     from qtpy.QtWidgets import (
@@ -21,20 +39,25 @@ try:
     )
     from qtpy.QtCore import Qt, QTimer
     from qtpy.QtGui import QFont
-    
+except ImportError as e:
+    print(f"Import error: {e}")
+    print("This demo requires QtPy with a Qt binding (PyQt5 or PySide2).")
+    sys.exit(1)
+
+try:
     # Import touch interface components
-    from probe_basic.touch_widgets import (
-        TouchButton, TouchPanel, TouchButtonRow, TouchLabel,
-        TouchFrame, create_touch_button_panel
-    )
-    from probe_basic.touch_utils import (
-        TouchThemeManager, TouchStyleHelper, apply_touch_optimizations
-    )
-    from probe_basic.touch_config import THEME_VARIANTS, SIZE_CLASSES
-    
+    with _probe_basic_on_path():
+        from probe_basic.touch_widgets import (
+            TouchButton, TouchPanel, TouchButtonRow, TouchLabel,
+            TouchFrame, create_touch_button_panel
+        )
+        from probe_basic.touch_utils import (
+            TouchThemeManager, TouchStyleHelper, apply_touch_optimizations
+        )
+        from probe_basic.touch_config import THEME_VARIANTS, SIZE_CLASSES
 except ImportError as e:
     print(f"Import error: {e}")
-    print("This demo requires QtPy and the PB-Touch modules.")
+    print("This demo requires the PB-Touch modules from probe_basic.")
     print("Some dependencies may not be available in this environment.")
     sys.exit(1)
 
@@ -187,8 +210,11 @@ class TouchInterfaceDemo(QMainWindow):
         )
         layout.addWidget(info_label)
         
-        # Create elements that respond to size changes
-        self.responsive_elements = []
+        # Create elements that respond to size changes, kept as parallel
+        # lists so a size change only has to touch the affected buttons
+        self._resp_buttons = []
+        self._resp_sizes = []
+        self._highlighted_index = None
         
         for i, (size_name, size_config) in enumerate(SIZE_CLASSES.items()):
             group = QGroupBox(f"{size_name.title()} Size Class")
@@ -196,13 +222,15 @@ class TouchInterfaceDemo(QMainWindow):
             
             btn = TouchButton(f"Button ({size_config['button_height']}px)")
             TouchStyleHelper.apply_touch_properties(btn, size_name)
+            btn.setProperty("highlighted", False)
             group_layout.addWidget(btn)
             
             label = TouchLabel(f"Font scale: {size_config['font_scale']}")
             group_layout.addWidget(label)
             
             layout.addWidget(group)
-            self.responsive_elements.append((btn, label, size_name))
+            self._resp_buttons.append(btn)
+            self._resp_sizes.append(size_name)
         
         layout.addStretch()
         
@@ -251,8 +279,8 @@ class TouchInterfaceDemo(QMainWindow):
             self.theme_combo.setCurrentText(self.theme_manager.get_current_theme())
             self.size_combo.setCurrentText(self.theme_manager.get_current_size_class())
             
-            # Apply initial theme
-            QTimer.singleShot(100, self.apply_current_theme)
+            # Apply initial theme on the next event loop turn
+            QTimer.singleShot(0, self.apply_current_theme)
             
         except Exception as e:
             print(f"Failed to initialize theme system: {e}")
@@ -269,17 +297,32 @@ class TouchInterfaceDemo(QMainWindow):
             self.theme_manager.set_size_class(size_class)
         
         # Update responsive elements
-        if hasattr(self, 'responsive_elements'):
-            for btn, label, element_size in self.responsive_elements:
-                # Highlight the current size class
-                if element_size == size_class:
-                    btn.setProperty("highlighted", True)
-                else:
-                    btn.setProperty("highlighted", False)
+        if hasattr(self, '_resp_sizes'):
+            # Highlight the current size class; only the previously and newly
+            # highlighted buttons change
+            if size_class in self._resp_sizes:
+                new_index = self._resp_sizes.index(size_class)
+            else:
+                new_index = None
+            if new_index == self._highlighted_index:
+                return
+            changed = [i for i in (self._highlighted_index, new_index) if i is not None]
+            
+            self.setUpdatesEnabled(False)
+            try:
+                for i in changed:
+                    self._resp_buttons[i].setProperty("highlighted", i == new_index)
                 
-                # Force style update
-                btn.style().unpolish(btn)
-                btn.style().polish(btn)
+                # Force style update in one pass once every property is set
+                for i in changed:
+                    btn = self._resp_buttons[i]
+                    btn.style().unpolish(btn)
+                for i in changed:
+                    btn = self._resp_buttons[i]
+                    btn.style().polish(btn)
+            finally:
+                self.setUpdatesEnabled(True)
+            self._highlighted_index = new_index
     
     def apply_current_theme(self):
         """Apply the current theme to the application"""
@@ -6,8 +6,9 @@ This file shows how to integrate the new dashboard widgets into the main UI
 """
 
 import os
-from qtpy.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFrame
-from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy
+from qtpy.QtCore import Qt, QSize
+from qtpy.QtGui import QPainter, QPalette
 
 # Import the new dashboard widgets
 try:
@@ -30,6 +31,42 @@ except ImportError as e:
     class ToolInfoPanel(QWidget):
         pass
 
+class _Separator(QWidget):
+    """
+    Sunken divider line painted directly, lighter than a QFrame VLine/HLine
+    """
+    
+    def __init__(self, orientation, parent=None):
+        super(_Separator, self).__init__(parent)
+        self._orientation = orientation
+        if orientation == Qt.Vertical:
+            self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
+        else:
+            self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        
+    def sizeHint(self):
+        return QSize(3, 3)
+        
+    def paintEvent(self, event):
+        # Same strokes qDrawShadeLine uses for a sunken one-pixel QFrame line
+        painter = QPainter(self)
+        palette = self.palette()
+        if self._orientation == Qt.Vertical:
+            x = self.width() // 2 - 1
+            y2 = self.height() - 1
+            painter.setPen(palette.color(QPalette.Dark))
+            painter.drawLine(x, 0, x, y2)
+            painter.drawPoint(x + 1, 0)
+            painter.setPen(palette.color(QPalette.Light))
+            painter.drawLine(x + 1, 1, x + 1, y2 - 1)
+        else:
+            y = self.height() // 2 - 1
+            x2 = self.width() - 1
+            painter.setPen(palette.color(QPalette.Dark))
+            painter.drawLine(0, y, x2, y)
+            painter.setPen(palette.color(QPalette.Light))
+            painter.drawLine(0, y + 1, x2 - 1, y + 1)
+
 class DashboardContainer(QWidget):
     """
     Container widget that organizes all Phase 1 dashboard components
@@ -58,9 +95,7 @@ class DashboardContainer(QWidget):
         top_row.addWidget(self.modal_hud)
         
         # Add separator
-        separator1 = QFrame()
-        separator1.setFrameShape(QFrame.VLine)
-        separator1.setFrameShadow(QFrame.Sunken)
+        separator1 = _Separator(Qt.Vertical)
         top_row.addWidget(separator1)
         
         # Status tiles
@@ -70,9 +105,7 @@ class DashboardContainer(QWidget):
         main_layout.addLayout(top_row)
         
         # Add horizontal separator
-        separator2 = QFrame()
-        separator2.setFrameShape(QFrame.HLine)
-        separator2.setFrameShadow(QFrame.Sunken)
+        separator2 = _Separator(Qt.Horizontal)
         main_layout.addWidget(separator2)
         
         # Second row: Tool Info Panel and Cycle Control Panel
@@ -84,9 +117,7 @@ class DashboardContainer(QWidget):
         second_row.addWidget(self.tool_info)
         
         # Add separator
-        separator3 = QFrame()
-        separator3.setFrameShape(QFrame.VLine)
-        separator3.setFrameShadow(QFrame.Sunken)
+        separator3 = _Separator(Qt.Vertical)
         second_row.addWidget(separator3)
         
         # Cycle controls
@@ -96,9 +127,7 @@ class DashboardContainer(QWidget):
         main_layout.addLayout(second_row)
         
         # Add horizontal separator
-        separator4 = QFrame()
-        separator4.setFrameShape(QFrame.HLine)
-        separator4.setFrameShadow(QFrame.Sunken)
+        separator4 = _Separator(Qt.Horizontal)
         main_layout.addWidget(separator4)
         
         # Bottom row: Alarms Panel
@@ -4,48 +4,24 @@ Phase 10 Help Overlay System
 Contextual help system with "?" button for probe_basic widgets
 """
 
+import importlib
+import importlib.util
 import json
 import os
+import pickle
+from collections.abc import MutableMapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Any
 
-try:
-    from PyQt5.QtWidgets import (
-        QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-        QTextEdit, QDialog, QFrame, QApplication, QScrollArea
-    )
-    from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-    from PyQt5.QtGui import QFont, QPalette, QPixmap
-    QT_AVAILABLE = True
-except ImportError:
-    # Define dummy classes when Qt is not available
-    QT_AVAILABLE = False
-    
-    class QDialog:
-        def __init__(self, *args, **kwargs): pass
-        def setWindowTitle(self, title): pass
-        def setModal(self, modal): pass
-        def setFixedSize(self, width, height): pass
-        def setStyleSheet(self, style): pass
-        def exec_(self): pass
-        def accept(self): pass
-    
-    class QPushButton:
-        def __init__(self, *args, **kwargs): pass
-        def setFixedSize(self, width, height): pass
-        def setStyleSheet(self, style): pass
-        def setToolTip(self, tip): pass
-        def clicked(self): return MockSignal()
-    
-    class QWidget:
-        def __init__(self, *args, **kwargs): pass
-        def width(self): return 100
-    
-    class MockSignal:
-        def connect(self, callback): pass
-        def emit(self, *args): pass
-    
-    def pyqtSignal(*args): return MockSignal()
+# The Qt widgets live in help_widgets and are only imported when first used,
+# so looking up help data does not load QtWidgets
+QT_AVAILABLE = importlib.util.find_spec('PyQt5') is not None
+_qt = None
+
+if TYPE_CHECKING:
+    from PyQt5.QtWidgets import QWidget
 
 try:
     from probe_basic.logging_config import get_ui_logger
@@ -55,231 +31,166 @@ except ImportError:
     import logging
     logger = logging.getLogger('help_system')
 
-class HelpOverlay(QDialog):
-    """Modal help overlay dialog with contextual information"""
-    
-    def __init__(self, widget_name: str, help_data: Dict[str, Any], parent=None):
-        if not QT_AVAILABLE:
+def _qt_widgets():
+    """Import the help_widgets module on first use"""
+    global _qt
+    if _qt is None:
+        if __package__:
+            _qt = importlib.import_module('.help_widgets', __package__)
+        else:
+            _qt = importlib.import_module('help_widgets')
+    return _qt
+
+if QT_AVAILABLE:
+    def __getattr__(name):
+        # HelpOverlay and HelpButton resolve to the Qt classes on first access
+        if name in ('HelpOverlay', 'HelpButton'):
+            return getattr(_qt_widgets(), name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+else:
+    class HelpOverlay:
+        def __init__(self, *args, **kwargs):
             raise ImportError("PyQt5 not available for HelpOverlay")
-            
-        super().__init__(parent)
-        self.widget_name = widget_name
-        self.help_data = help_data
-        
-        self.setWindowTitle(f"Help: {widget_name}")
-        self.setModal(True)
-        self.setFixedSize(600, 400)
-        
-        # Style for overlay
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                border: 2px solid #0078d4;
-                border-radius: 8px;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 14px;
-            }
-            QTextEdit {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-        """)
-        
-        self._setup_ui()
-        
-    def _setup_ui(self):
-        """Setup the help overlay UI"""
-        layout = QVBoxLayout(self)
-        layout.setSpacing(16)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title_label = QLabel(self.help_data.get('title', self.widget_name))
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(16)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
-        
-        # Description
-        if 'description' in self.help_data:
-            desc_label = QLabel(self.help_data['description'])
-            desc_label.setWordWrap(True)
-            layout.addWidget(desc_label)
-        
-        # Content area with scroll
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameStyle(QFrame.NoFrame)
-        
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        
-        # Usage instructions
-        if 'usage' in self.help_data:
-            usage_label = QLabel("Usage:")
-            usage_font = QFont()
-            usage_font.setBold(True)
-            usage_label.setFont(usage_font)
-            content_layout.addWidget(usage_label)
-            
-            usage_text = QTextEdit()
-            usage_text.setPlainText(self.help_data['usage'])
-            usage_text.setMaximumHeight(120)
-            content_layout.addWidget(usage_text)
-        
-        # Tips
-        if 'tips' in self.help_data and self.help_data['tips']:
-            tips_label = QLabel("Tips:")
-            tips_font = QFont()
-            tips_font.setBold(True)
-            tips_label.setFont(tips_font)
-            content_layout.addWidget(tips_label)
-            
-            for tip in self.help_data['tips']:
-                tip_label = QLabel(f"• {tip}")
-                tip_label.setWordWrap(True)
-                content_layout.addWidget(tip_label)
-        
-        # Safety notes
-        if 'safety' in self.help_data and self.help_data['safety']:
-            safety_label = QLabel("⚠️ Safety Notes:")
-            safety_font = QFont()
-            safety_font.setBold(True)
-            safety_label.setFont(safety_font)
-            safety_label.setStyleSheet("color: #ff9500;")
-            content_layout.addWidget(safety_label)
-            
-            for safety_note in self.help_data['safety']:
-                safety_note_label = QLabel(f"• {safety_note}")
-                safety_note_label.setWordWrap(True)
-                safety_note_label.setStyleSheet("color: #ff9500;")
-                content_layout.addWidget(safety_note_label)
-        
-        scroll_area.setWidget(content_widget)
-        layout.addWidget(scroll_area)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        if 'related_docs' in self.help_data:
-            docs_button = QPushButton("View Documentation")
-            docs_button.clicked.connect(self._open_documentation)
-            button_layout.addWidget(docs_button)
-        
-        button_layout.addStretch()
-        
-        close_button = QPushButton("Close")
-        close_button.clicked.connect(self.accept)
-        button_layout.addWidget(close_button)
-        
-        layout.addLayout(button_layout)
     
-    def _open_documentation(self):
-        """Open related documentation"""
-        import webbrowser
-        docs_url = self.help_data.get('related_docs', '')
-        if docs_url:
-            webbrowser.open(docs_url)
-            logger.info(f"Opened documentation for {self.widget_name}: {docs_url}")
+    class HelpButton:
+        def __init__(self, *args, **kwargs):
+            raise ImportError("PyQt5 not available for HelpButton")
+
+# Generic content for widgets without a help file
+_DEFAULT_TIPS = ('Click on controls to activate them', 'Use keyboard shortcuts when available')
+_DEFAULT_SAFETY = ('Always ensure machine is in a safe state before operation',)
+
+# Prebuilt pickle of every help JSON file, see build_help_bundle()
+HELP_BUNDLE_NAME = 'help_data.pkl'
+
+def _scan_help_dir(help_data_dir: Path):
+    """Return the bundle DirEntry (or None) and the JSON help file DirEntries by widget name"""
+    bundle = None
+    help_files = {}
+    with os.scandir(help_data_dir) as entries:
+        for entry in entries:
+            if entry.name == HELP_BUNDLE_NAME:
+                bundle = entry
+            elif entry.name.endswith('.json') and entry.is_file():
+                help_files[os.path.splitext(entry.name)[0]] = entry
+    return bundle, help_files
+
+def _freeze(value):
+    """Return a read-only view of parsed JSON: dicts as mappingproxies, lists as tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+@lru_cache(maxsize=256)
+def _load_file(path: str, mtime_ns: int) -> Mapping[str, Any]:
+    """Parse a help JSON file, cached per (path, mtime) pair and shared read-only"""
+    with open(path, 'r') as f:
+        return _freeze(json.load(f))
 
-class HelpButton(QPushButton):
-    """Help button widget that shows contextual help"""
+class _HelpData(MutableMapping):
+    """Help records keyed by widget name, parsed from disk on first access"""
     
-    help_requested = pyqtSignal(str)  # Signal emitted when help is requested
+    def __init__(self):
+        self._files: Dict[str, str] = {}
+        self._added: Dict[str, Dict[str, Any]] = {}
     
-    def __init__(self, widget_name: str, parent=None):
-        if not QT_AVAILABLE:
-            raise ImportError("PyQt5 not available for HelpButton")
-            
-        super().__init__("?", parent)
-        self.widget_name = widget_name
-        
-        # Style the help button
-        self.setFixedSize(24, 24)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-        """)
-        
-        self.setToolTip(f"Click for help with {widget_name}")
-        self.clicked.connect(self._show_help)
-        
-    def _show_help(self):
-        """Show help for this widget"""
-        self.help_requested.emit(self.widget_name)
+    def index_file(self, widget_name: str, path: str):
+        """Register a help file without reading it"""
+        self._files[widget_name] = path
+    
+    def __getitem__(self, widget_name: str) -> Mapping[str, Any]:
+        if widget_name in self._added:
+            return self._added[widget_name]
+        path = self._files[widget_name]
+        try:
+            data = _load_file(path, os.stat(path).st_mtime_ns)
+        except Exception as e:
+            logger.error(f"Error loading help data from {path}: {e}")
+            raise KeyError(widget_name) from e
+        logger.debug(f"Loaded help data for {widget_name}")
+        return data
+    
+    def __setitem__(self, widget_name: str, data: Dict[str, Any]):
+        self._added[widget_name] = data
+    
+    def __delitem__(self, widget_name: str):
+        if widget_name not in self:
+            raise KeyError(widget_name)
+        self._added.pop(widget_name, None)
+        self._files.pop(widget_name, None)
+    
+    def __iter__(self):
+        yield from self._files
+        yield from (name for name in self._added if name not in self._files)
+    
+    def __len__(self) -> int:
+        return len(self._files.keys() | self._added.keys())
+    
+    def __contains__(self, widget_name) -> bool:
+        return widget_name in self._files or widget_name in self._added
 
 class HelpManager:
     """Manages contextual help for probe_basic widgets"""
     
     def __init__(self, help_data_dir: Optional[Path] = None):
         self.help_data_dir = help_data_dir or Path(__file__).parent / 'help_data'
-        self.help_data: Dict[str, Dict[str, Any]] = {}
+        self.help_data = _HelpData()
+        self._overlays: Dict[str, 'HelpOverlay'] = {}
         self.load_help_data()
         
     def load_help_data(self):
-        """Load help data from JSON files"""
+        """Load the prebuilt help bundle, or index the JSON help files for lazy parsing"""
         if not self.help_data_dir.exists():
             logger.warning(f"Help data directory not found: {self.help_data_dir}")
             return
             
-        for help_file in self.help_data_dir.glob('*.json'):
-            try:
-                with open(help_file, 'r') as f:
-                    data = json.load(f)
-                    widget_name = help_file.stem
-                    self.help_data[widget_name] = data
-                    logger.debug(f"Loaded help data for {widget_name}")
-            except Exception as e:
-                logger.error(f"Error loading help data from {help_file}: {e}")
+        bundle, help_files = _scan_help_dir(self.help_data_dir)
+        if bundle is not None and self._load_bundle(bundle, help_files):
+            return
+        for widget_name, entry in help_files.items():
+            self.help_data.index_file(widget_name, entry.path)
+    
+    def _load_bundle(self, bundle: os.DirEntry, help_files: Dict[str, os.DirEntry]) -> bool:
+        """Load all help records from the bundle if it matches the JSON files on disk"""
+        bundle_mtime = bundle.stat().st_mtime_ns
+        if any(entry.stat().st_mtime_ns > bundle_mtime for entry in help_files.values()):
+            logger.debug(f"Help bundle {bundle.path} is stale, using JSON files")
+            return False
+        try:
+            with open(bundle.path, 'rb') as f:
+                records = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Error loading help bundle {bundle.path}: {e}")
+            return False
+        # A help file added or removed since the build leaves no newer mtime behind
+        if records.keys() != help_files.keys():
+            logger.debug(f"Help bundle {bundle.path} does not match the JSON files, using them")
+            return False
+        # Freeze like _load_file so both paths hand out the same read-only records
+        self.help_data.update({name: _freeze(data) for name, data in records.items()})
+        logger.debug(f"Loaded help bundle with {len(records)} widgets")
+        return True
     
-    def get_help_data(self, widget_name: str) -> Dict[str, Any]:
+    def get_help_data(self, widget_name: str) -> Mapping[str, Any]:
         """Get help data for a widget"""
-        return self.help_data.get(widget_name, self._get_default_help_data(widget_name))
+        help_data = self.help_data.get(widget_name)
+        if help_data is None:
+            return self._get_default_help_data(widget_name)
+        return help_data
     
-    def _get_default_help_data(self, widget_name: str) -> Dict[str, Any]:
-        """Get default help data for unknown widgets"""
-        return {
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_default_help_data(widget_name: str) -> Mapping[str, Any]:
+        """Get default help data for unknown widgets, shared read-only per name"""
+        return MappingProxyType({
             'title': widget_name.replace('_', ' ').title(),
             'description': f'This is the {widget_name} component.',
             'usage': f'Use the {widget_name} to interact with the system.',
-            'tips': ['Click on controls to activate them', 'Use keyboard shortcuts when available'],
-            'safety': ['Always ensure machine is in a safe state before operation']
-        }
+            'tips': _DEFAULT_TIPS,
+            'safety': _DEFAULT_SAFETY
+        })
     
     def show_help(self, widget_name: str, parent=None):
         """Show help overlay for a widget"""
@@ -288,28 +199,77 @@ class HelpManager:
             return
             
         help_data = self.get_help_data(widget_name)
-        overlay = HelpOverlay(widget_name, help_data, parent)
-        overlay.exec_()
+        overlay = self._overlays.get(widget_name)
+        # Rebuild when the help data was reloaded or the overlay belongs elsewhere
+        if overlay is None or overlay.help_data is not help_data or overlay.parent() is not parent:
+            if overlay is not None:
+                self._discard_overlay(overlay)
+            overlay = _qt_widgets().HelpOverlay(widget_name, help_data, parent)
+            overlay.destroyed.connect(lambda: self._overlays.pop(widget_name, None))
+            self._overlays[widget_name] = overlay
+        overlay.show()
+        overlay.raise_()
+        overlay.activateWindow()
         logger.info(f"Showed help for {widget_name}")
     
-    def add_help_button(self, widget: QWidget, widget_name: str) -> HelpButton:
+    def clear_overlays(self):
+        """Drop the cached overlays, e.g. after a theme change"""
+        for overlay in self._overlays.values():
+            self._discard_overlay(overlay)
+        self._overlays.clear()
+    
+    @staticmethod
+    def _discard_overlay(overlay):
+        """Delete a cached overlay without letting it evict its replacement"""
+        overlay.destroyed.disconnect()
+        overlay.deleteLater()
+    
+    def add_help_button(self, widget: 'QWidget', widget_name: str) -> 'HelpButton':
         """Add a help button to a widget"""
         if not QT_AVAILABLE:
             raise ImportError("PyQt5 not available for help button")
             
-        help_button = HelpButton(widget_name, widget)
+        from PyQt5.QtWidgets import QApplication
+        self._ensure_global_qss(QApplication.instance())
+        help_button = _qt_widgets().HelpButton(widget_name, widget)
         help_button.help_requested.connect(lambda name: self.show_help(name, widget))
         
-        # Position the help button in the top-right corner of the widget
-        help_button.move(widget.width() - 30, 6)
+        # Pin the help button to the top-right corner of the widget
+        help_button.attach_to_corner()
         
         return help_button
     
+    @staticmethod
+    def _ensure_global_qss(app):
+        """Append the help button rules to the application stylesheet once"""
+        if app is None or '#helpBtn' in app.styleSheet():
+            return
+        app.setStyleSheet(app.styleSheet() + help_button_style())
+    
     def add_help_data(self, widget_name: str, help_data: Dict[str, Any]):
         """Add help data for a widget programmatically"""
         self.help_data[widget_name] = help_data
         logger.debug(f"Added help data for {widget_name}")
 
+def build_help_bundle(help_data_dir: Optional[Path] = None) -> Path:
+    """Parse every JSON help file and write them all to a single pickle bundle"""
+    help_data_dir = Path(help_data_dir or Path(__file__).parent / 'help_data')
+    records = {}
+    _, help_files = _scan_help_dir(help_data_dir)
+    for widget_name in sorted(help_files):
+        with open(help_files[widget_name].path, 'r') as f:
+            records[widget_name] = json.load(f)
+    
+    bundle_path = help_data_dir / HELP_BUNDLE_NAME
+    with open(bundle_path, 'wb') as f:
+        pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+    logger.info(f"Wrote help bundle with {len(records)} widgets to {bundle_path}")
+    return bundle_path
+
+def help_button_style() -> str:
+    """QSS rules for the help buttons, for code that replaces the application stylesheet"""
+    return _qt_widgets().HelpButton._STYLE
+
 # Global help manager instance
 _help_manager: Optional[HelpManager] = None
 
@@ -324,7 +284,7 @@ def show_widget_help(widget_name: str, parent=None):
     """Convenience function to show help for a widget"""
     get_help_manager().show_help(widget_name, parent)
 
-def add_help_button_to_widget(widget: QWidget, widget_name: str) -> Optional[HelpButton]:
+def add_help_button_to_widget(widget: 'QWidget', widget_name: str) -> Optional['HelpButton']:
     """Convenience function to add help button to a widget"""
     if not QT_AVAILABLE:
         return None
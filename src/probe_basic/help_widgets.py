@@ -0,0 +1,256 @@
+"""
+Phase 10 Help Overlay Widgets
+Qt dialog and "?" button for the help system, loaded on first use
+"""
+
+import html
+from functools import lru_cache
+from typing import Any, Dict
+
+from PyQt5.QtCore import QEvent, Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (
+    QDialog,
+    QFrame,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QScrollArea,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+
+try:
+    from probe_basic.logging_config import get_ui_logger
+    logger = get_ui_logger()
+except ImportError:
+    # Fallback logging when probe_basic not available
+    import logging
+    logger = logging.getLogger('help_system')
+
+def _bullet_list_html(items, style: str = '') -> str:
+    """Render a list of strings as one rich-text bullet list"""
+    rows = ''.join(f"<li>{html.escape(str(item))}</li>" for item in items)
+    return f'<ul style="{style}">{rows}</ul>'
+
+@lru_cache(maxsize=1)
+def _compiled_overlay_style() -> str:
+    """Overlay stylesheet with whitespace collapsed, built once"""
+    # cache_clear() after changing HelpOverlay._STYLE to restyle new overlays
+    return ' '.join(HelpOverlay._STYLE.split())
+
+class HelpOverlay(QDialog):
+    """Modal help overlay dialog with contextual information"""
+    
+    # Shared by every overlay
+    _STYLE = """
+        QDialog {
+            background-color: #2b2b2b;
+            border: 2px solid #0078d4;
+            border-radius: 8px;
+        }
+        QLabel {
+            color: #ffffff;
+            font-size: 14px;
+        }
+        QTextEdit {
+            background-color: #3c3c3c;
+            color: #ffffff;
+            border: 1px solid #555555;
+            border-radius: 4px;
+            padding: 8px;
+            font-size: 12px;
+        }
+        QPushButton {
+            background-color: #0078d4;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 16px;
+            font-size: 12px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #106ebe;
+        }
+        QPushButton:pressed {
+            background-color: #005a9e;
+        }
+    """
+    
+    # Section fonts, created by _init_fonts() on first use
+    _BOLD_FONT = None
+    _TITLE_FONT = None
+    
+    def __init__(self, widget_name: str, help_data: Dict[str, Any], parent=None):
+        super().__init__(parent)
+        self.widget_name = widget_name
+        self.help_data = help_data
+        
+        self.setWindowTitle(f"Help: {widget_name}")
+        self.setModal(True)
+        self.setFixedSize(600, 400)
+        
+        self.setStyleSheet(_compiled_overlay_style())
+        
+        # The widget tree is built on first show
+        self._ui_built = False
+        
+    def showEvent(self, event):
+        """Build the UI the first time the overlay is shown"""
+        if not self._ui_built:
+            self._setup_ui()
+            self._ui_built = True
+        super().showEvent(event)
+        
+    @classmethod
+    def _init_fonts(cls):
+        """Create the fonts shared by all overlays"""
+        if cls._BOLD_FONT is not None:
+            return
+        cls._BOLD_FONT = QFont()
+        cls._BOLD_FONT.setBold(True)
+        cls._TITLE_FONT = QFont(cls._BOLD_FONT)
+        cls._TITLE_FONT.setPointSize(16)
+        
+    def _setup_ui(self):
+        """Setup the help overlay UI"""
+        self._init_fonts()
+        layout = QVBoxLayout(self)
+        layout.setSpacing(16)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        # Title
+        title_label = QLabel(self.help_data.get('title', self.widget_name))
+        title_label.setFont(self._TITLE_FONT)
+        title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title_label)
+        
+        # Description
+        if 'description' in self.help_data:
+            desc_label = QLabel(self.help_data['description'])
+            desc_label.setWordWrap(True)
+            layout.addWidget(desc_label)
+        
+        # Content area with scroll
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameStyle(QFrame.NoFrame)
+        
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+        
+        # Usage instructions
+        if 'usage' in self.help_data:
+            usage_label = QLabel("Usage:")
+            usage_label.setFont(self._BOLD_FONT)
+            content_layout.addWidget(usage_label)
+            
+            usage_text = QTextEdit()
+            usage_text.setPlainText(self.help_data['usage'])
+            usage_text.setMaximumHeight(120)
+            content_layout.addWidget(usage_text)
+        
+        # Tips
+        if 'tips' in self.help_data and self.help_data['tips']:
+            tips_label = QLabel("Tips:")
+            tips_label.setFont(self._BOLD_FONT)
+            content_layout.addWidget(tips_label)
+            
+            tips_list_label = QLabel(_bullet_list_html(self.help_data['tips']))
+            tips_list_label.setTextFormat(Qt.RichText)
+            tips_list_label.setWordWrap(True)
+            content_layout.addWidget(tips_list_label)
+        
+        # Safety notes
+        if 'safety' in self.help_data and self.help_data['safety']:
+            safety_label = QLabel("⚠️ Safety Notes:")
+            safety_label.setFont(self._BOLD_FONT)
+            safety_label.setStyleSheet("color: #ff9500;")
+            content_layout.addWidget(safety_label)
+            
+            safety_notes_label = QLabel(
+                _bullet_list_html(self.help_data['safety'], "color: #ff9500;"))
+            safety_notes_label.setTextFormat(Qt.RichText)
+            safety_notes_label.setWordWrap(True)
+            content_layout.addWidget(safety_notes_label)
+        
+        scroll_area.setWidget(content_widget)
+        layout.addWidget(scroll_area)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        if 'related_docs' in self.help_data:
+            docs_button = QPushButton("View Documentation")
+            docs_button.clicked.connect(self._open_documentation)
+            button_layout.addWidget(docs_button)
+        
+        button_layout.addStretch()
+        
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+        
+        layout.addLayout(button_layout)
+    
+    def _open_documentation(self):
+        """Open related documentation"""
+        import webbrowser
+        docs_url = self.help_data.get('related_docs', '')
+        if docs_url:
+            webbrowser.open(docs_url)
+            logger.info(f"Opened documentation for {self.widget_name}: {docs_url}")
+
+class HelpButton(QPushButton):
+    """Help button widget that shows contextual help"""
+    
+    help_requested = pyqtSignal(str)  # Signal emitted when help is requested
+    
+    # Installed once on the application by HelpManager._ensure_global_qss
+    _STYLE = """
+        QPushButton#helpBtn {
+            background-color: #0078d4;
+            color: white;
+            border: none;
+            border-radius: 12px;
+            font-size: 14px;
+            font-weight: bold;
+        }
+        QPushButton#helpBtn:hover {
+            background-color: #106ebe;
+        }
+        QPushButton#helpBtn:pressed {
+            background-color: #005a9e;
+        }
+    """
+    
+    def __init__(self, widget_name: str, parent=None):
+        super().__init__("?", parent)
+        self.widget_name = widget_name
+        
+        # Styled by the application-wide helpBtn rules
+        self.setFixedSize(24, 24)
+        self.setObjectName("helpBtn")
+        
+        self.setToolTip(f"Click for help with {widget_name}")
+        self.clicked.connect(self._show_help)
+        
+    def attach_to_corner(self):
+        """Keep the button in the parent's top-right corner as it resizes"""
+        self.parentWidget().installEventFilter(self)
+        self._move_to_corner()
+        
+    def eventFilter(self, obj, event):
+        if obj is self.parentWidget() and event.type() == QEvent.Resize:
+            self._move_to_corner()
+        return super().eventFilter(obj, event)
+        
+    def _move_to_corner(self):
+        """Position the button in the top-right corner of its parent"""
+        self.move(self.parentWidget().width() - 30, 6)
+        
+    def _show_help(self):
+        """Show help for this widget"""
+        self.help_requested.emit(self.widget_name)
@@ -4,10 +4,14 @@ Probe Basic Logging Configuration
 Phase 10 - Centralized logging system with rotating files per subsystem
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict
 
@@ -22,60 +26,392 @@ SUBSYSTEM_SAFETY = 'safety'
 SUBSYSTEM_NETWORK = 'network'
 SUBSYSTEM_DIAGNOSTICS = 'diagnostics'
 
-# Default log directory
-DEFAULT_LOG_DIR = Path.home() / '.probe_basic' / 'logs'
+# Caller fields reported when the caller lookup is skipped
+_NO_CALLER_INFO = ('(unknown file)', 0, '(unknown function)', None)
+
+# Default log directory, resolved on first use by _default_log_dir()
+_DEFAULT_LOG_DIR: Optional[Path] = None
+
+# Level names accepted by ProbeBasicLogger, in upper and lower case
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ('NOTSET', 'DEBUG', 'INFO', 'WARN', 'WARNING',
+                 'ERROR', 'FATAL', 'CRITICAL')
+}
+_LEVELS.update({name.lower(): value for name, value in _LEVELS.items()})
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that tracks the file size instead of asking the stream"""
+    
+    def _open(self):
+        stream = self._open_stream()
+        # The stock check calls stream.tell(), which flushes a buffered text
+        # stream; keep our own count of the bytes written instead
+        self._stream_pos = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def _open_stream(self):
+        return super()._open()
+    
+    def emit(self, record):
+        """
+        Emit a record, rolling the file over first if it would exceed maxBytes
+        
+        The record is formatted once, and the rollover decision uses the byte
+        count kept since the stream was opened, so no stat or tell() happens
+        per record.
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if msg.isascii():
+                size = len(msg)
+            else:
+                size = len(msg.encode(self.stream.encoding, self.stream.errors))
+            if self.maxBytes > 0 and self._stream_pos + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._stream_pos += size
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class FastFormatter(logging.Formatter):
+    """Formatter that reuses the timestamp text for records in the same second"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, '')
+    
+    def formatTime(self, record, datefmt=None):
+        # Without a datefmt the default output includes milliseconds
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._cached_time = (second, text)
+        return text
+
+# Write buffer size and longest time a buffered record may wait to be flushed
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.25
+
+class BufferedRotatingFileHandler(FastRotatingFileHandler):
+    """
+    Rotating file handler that batches records in a 64 KiB write buffer
+    
+    Records below WARNING stay in the buffer until flush() is called from
+    outside emit, which BatchingQueueListener does once per burst of records.
+    WARNING and above are flushed and synced to disk immediately.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._defer_flush = False
+        super().__init__(*args, **kwargs)
+    
+    def _open_stream(self):
+        # FileHandler only has an errors attribute from Python 3.9
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record):
+        urgent = record.levelno >= logging.WARNING
+        self._defer_flush = not urgent
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+        if urgent and self.stream is not None and hasattr(os, 'fdatasync'):
+            os.fdatasync(self.stream.fileno())
+    
+    def flush(self):
+        # StreamHandler.emit flushes after every record; leave deferred
+        # records in the buffer for the next burst flush
+        if not self._defer_flush:
+            super().flush()
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that flushes its handlers once per burst of records
+    
+    Handlers are flushed when the queue runs empty, or every flush_interval
+    seconds while records keep arriving, so each log file gets one write per
+    burst instead of one per record.
+    
+    Besides the handlers that see every record, a handler can be routed a
+    logger name with add_route; it then only receives records from that
+    logger and its children, found with a cached lookup on record.name.
+    """
+    
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 flush_interval: float = LOG_FLUSH_INTERVAL):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self.routes: Dict[str, logging.Handler] = {}
+        self._route_cache: Dict[str, Optional[logging.Handler]] = {}
+    
+    def add_route(self, logger_name: str, handler: logging.Handler):
+        """
+        Send records from a logger and its children to an extra handler
+        
+        Args:
+            logger_name: Logger name, e.g. 'probe_basic.ui'
+            handler: Handler that receives the records
+        """
+        # Replace rather than mutate so the listener thread never sees a
+        # dict change size while reading it
+        self.routes = {**self.routes, logger_name: handler}
+        self._route_cache = {}
+    
+    def _route(self, name: str) -> Optional[logging.Handler]:
+        route_cache = self._route_cache
+        try:
+            return route_cache[name]
+        except KeyError:
+            pass
+        
+        routes = self.routes
+        handler = None
+        prefix = name
+        while prefix:
+            handler = routes.get(prefix)
+            if handler is not None:
+                break
+            prefix = prefix.rpartition('.')[0]
+        
+        route_cache[name] = handler
+        return handler
+    
+    def handle(self, record):
+        record = self.prepare(record)
+        respect_level = self.respect_handler_level
+        
+        for handler in self.handlers:
+            if not respect_level or record.levelno >= handler.level:
+                handler.handle(record)
+        
+        handler = self._route(record.name)
+        if handler is not None and (not respect_level or record.levelno >= handler.level):
+            handler.handle(record)
+    
+    def flush_handlers(self):
+        """Flush every handler attached to the listener, routed ones included"""
+        for handler in (*self.handlers, *self.routes.values()):
+            # As in logging.shutdown, a stream closed by its owner (e.g. a
+            # replaced sys.stdout at exit) is not an error here
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                pass
+    
+    def stop(self):
+        """Write out queued records and stop the thread; safe to call twice"""
+        # QueueListener.stop fails on a second call before Python 3.12
+        if self._thread is not None:
+            super().stop()
+    
+    def close(self):
+        """Stop the listener and close every handler attached to it"""
+        self.stop()
+        for handler in (*self.handlers, *self.routes.values()):
+            handler.close()
+    
+    def _monitor(self):
+        q = self.queue
+        has_task_done = hasattr(q, 'task_done')
+        last_flush = time.monotonic()
+        
+        while True:
+            record = self.dequeue(True)
+            if record is self._sentinel:
+                self.flush_handlers()
+                if has_task_done:
+                    q.task_done()
+                break
+            
+            self.handle(record)
+            
+            now = time.monotonic()
+            if q.empty() or now - last_flush >= self.flush_interval:
+                self.flush_handlers()
+                last_flush = now
+            
+            if has_task_done:
+                q.task_done()
+
+class _ListenerQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that remembers the listener draining its queue"""
+    
+    def __init__(self, listener: BatchingQueueListener):
+        super().__init__(listener.queue)
+        self.listener = listener
+
+def _default_log_dir() -> Path:
+    """Return ~/.probe_basic/logs, looking up the home directory only once"""
+    global _DEFAULT_LOG_DIR
+    
+    if _DEFAULT_LOG_DIR is None:
+        _DEFAULT_LOG_DIR = Path.home() / '.probe_basic' / 'logs'
+    
+    return _DEFAULT_LOG_DIR
+
+def __getattr__(name):
+    # DEFAULT_LOG_DIR is kept importable without resolving it at import time
+    if name == 'DEFAULT_LOG_DIR':
+        return _default_log_dir()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class _NoCallerInfoLogger(logging.Logger):
+    """Logger that skips the stack walk for the calling function"""
+    
+    def findCaller(self, stack_info=False, stacklevel=1):
+        # The real lookup still runs when a stack trace was asked for; this
+        # frame is one more level to skip on every supported version
+        if stack_info:
+            return super().findCaller(stack_info, stacklevel + 1)
+        return _NO_CALLER_INFO
+
+def _set_caller_lookup(logger: logging.Logger, enabled: bool):
+    """
+    Enable or disable the stack walk a logger does to find the calling function
+    
+    With the lookup disabled, records get placeholder file/line/function
+    fields; the real lookup still runs when stack_info is requested.
+    Loggers of a custom logger class are left unchanged.
+    
+    Args:
+        logger: Logger to modify
+        enabled: Whether records should carry real caller information
+    """
+    if type(logger) not in (logging.Logger, _NoCallerInfoLogger):
+        return
+    logger.__class__ = logging.Logger if enabled else _NoCallerInfoLogger
+
+def _level_from_name(level: str) -> int:
+    """
+    Convert a level name to its logging constant
+    
+    Args:
+        level: Level name in any case (e.g. 'DEBUG', 'info')
+        
+    Returns:
+        Numeric logging level, logging.INFO for unknown names
+    """
+    log_level = _LEVELS.get(level)
+    if log_level is None:
+        log_level = _LEVELS.get(level.upper(), logging.INFO)
+    return log_level
 
 class ProbeBasicLogger:
     """Centralized logging manager for Probe Basic subsystems"""
     
-    def __init__(self, log_dir: Optional[Path] = None, log_level: str = 'INFO'):
+    def __init__(self, log_dir: Optional[Path] = None, log_level: str = 'INFO',
+                 use_caller_info: bool = True):
         """
         Initialize the logging system
         
         Args:
             log_dir: Directory for log files (defaults to ~/.probe_basic/logs)
             log_level: Default logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            use_caller_info: Record the calling function in subsystem log files;
+                False skips the stack walk this costs for every record
         """
-        self.log_dir = log_dir or DEFAULT_LOG_DIR
-        self.log_level = getattr(logging, log_level.upper(), logging.INFO)
+        self.log_dir = log_dir or _default_log_dir()
+        self.log_level = _level_from_name(log_level)
         self.loggers: Dict[str, logging.Logger] = {}
+        self.use_caller_info = use_caller_info
+        
+        # Serializes subsystem logger creation; lookups of existing loggers
+        # do not take it
+        self._lock = threading.Lock()
+        
+        # Loggers only enqueue records; formatting and file I/O happen on the
+        # listener thread started in _setup_root_logger
+        self._log_queue: 'queue.Queue[logging.LogRecord]' = queue.Queue(-1)
+        self._listener: Optional[BatchingQueueListener] = None
+        
+        # Subsystem format includes function name for debugging; one instance
+        # is shared so its timestamp cache serves every subsystem file
+        if use_caller_info:
+            subsystem_format = '[%(asctime)s] [%(levelname)8s] [%(funcName)s] %(message)s'
+        else:
+            subsystem_format = '[%(asctime)s] [%(levelname)8s] %(message)s'
+        self._subsystem_formatter = FastFormatter(
+            subsystem_format,
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
         
         # Ensure log directory exists
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        if not self.log_dir.is_dir():
+            self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Configure root logger
         self._setup_root_logger()
     
     def _setup_root_logger(self):
-        """Setup root logger with console handler"""
+        """
+        Setup root logger with a queue handler feeding the console and main file handlers
+        
+        Subsystem loggers propagate here too; their records are routed to the
+        subsystem files by the listener rather than by handlers of their own.
+        """
         root_logger = logging.getLogger('probe_basic')
         root_logger.setLevel(self.log_level)
+        _set_caller_lookup(root_logger, self.use_caller_info)
         
-        # Remove existing handlers to avoid duplicates
+        # Remove existing handlers to avoid duplicates; a previous instance's
+        # listener thread and files are shut down with its queue handler
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+            if isinstance(handler, _ListenerQueueHandler):
+                handler.listener.close()
         
         # Console handler with colored output
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(self.log_level)
         
         # Format: [TIMESTAMP] [LEVEL] [SUBSYSTEM] MESSAGE
-        formatter = logging.Formatter(
+        formatter = FastFormatter(
             '[%(asctime)s] [%(levelname)8s] [%(name)s] %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
         
         # Main log file handler (all messages)
-        main_file_handler = logging.handlers.RotatingFileHandler(
+        main_file_handler = BufferedRotatingFileHandler(
             self.log_dir / 'probe_basic.log',
             maxBytes=10 * 1024 * 1024,  # 10MB per file
             backupCount=5
         )
         main_file_handler.setLevel(logging.DEBUG)
         main_file_handler.setFormatter(formatter)
-        root_logger.addHandler(main_file_handler)
+        
+        self._listener = BatchingQueueListener(
+            self._log_queue, console_handler, main_file_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._stop_listener)
+        root_logger.addHandler(_ListenerQueueHandler(self._listener))
+    
+    def _stop_listener(self):
+        """Write out queued records and stop the listener thread"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+    
+    def flush(self):
+        """Block until every record logged so far has been handled"""
+        if self._listener is not None:
+            self._log_queue.join()
+            self._listener.flush_handlers()
     
     def get_logger(self, subsystem: str) -> logging.Logger:
         """
@@ -87,35 +423,43 @@ class ProbeBasicLogger:
         Returns:
             Logger instance for the subsystem
         """
-        if subsystem in self.loggers:
-            return self.loggers[subsystem]
-        
-        # Create logger with subsystem-specific name
-        logger_name = f'probe_basic.{subsystem}'
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(self.log_level)
+        logger = self.loggers.get(subsystem)
+        if logger is not None:
+            return logger
         
-        # Subsystem-specific file handler
-        log_file = self.log_dir / f'{subsystem}.log'
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=5 * 1024 * 1024,  # 5MB per subsystem file
-            backupCount=3
-        )
-        file_handler.setLevel(logging.DEBUG)
-        
-        # Subsystem format includes function name for debugging
-        formatter = logging.Formatter(
-            '[%(asctime)s] [%(levelname)8s] [%(funcName)s] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
-        # Store reference
-        self.loggers[subsystem] = logger
-        
-        return logger
+        with self._lock:
+            # Another thread may have created it while we waited
+            logger = self.loggers.get(subsystem)
+            if logger is not None:
+                return logger
+            
+            # Create logger with subsystem-specific name
+            logger_name = f'probe_basic.{subsystem}'
+            logger = logging.getLogger(logger_name)
+            logger.setLevel(self.log_level)
+            _set_caller_lookup(logger, self.use_caller_info)
+            
+            # Subsystem-specific file handler. Once the listener has been
+            # stopped at exit nothing would be written, so none is created
+            listener = self._listener
+            if listener is not None:
+                log_file = self.log_dir / f'{subsystem}.log'
+                file_handler = BufferedRotatingFileHandler(
+                    log_file,
+                    maxBytes=5 * 1024 * 1024,  # 5MB per subsystem file
+                    backupCount=3
+                )
+                file_handler.setLevel(logging.DEBUG)
+                file_handler.setFormatter(self._subsystem_formatter)
+                
+                # Records reach the listener through the probe_basic queue
+                # handler, which routes this subsystem's records to its file
+                listener.add_route(logger_name, file_handler)
+            
+            # Store reference
+            self.loggers[subsystem] = logger
+            
+            return logger
     
     def set_level(self, level: str, subsystem: Optional[str] = None):
         """
@@ -125,7 +469,7 @@ class ProbeBasicLogger:
             level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             subsystem: Specific subsystem to update (None for all)
         """
-        log_level = getattr(logging, level.upper(), logging.INFO)
+        log_level = _level_from_name(level)
         
         if subsystem:
             if subsystem in self.loggers:
@@ -140,9 +484,12 @@ class ProbeBasicLogger:
         """
         Get dict of subsystem -> log file path mappings
         
+        Pending records are written out first so the files are up to date.
+        
         Returns:
             Dictionary mapping subsystem names to log file paths
         """
+        self.flush()
         log_files = {'main': self.log_dir / 'probe_basic.log'}
         
         for subsystem in self.loggers:
@@ -157,28 +504,37 @@ class ProbeBasicLogger:
         Args:
             days_to_keep: Number of days of logs to retain
         """
-        import time
         cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
+        logger = logging.getLogger('probe_basic')
         
-        for log_file in self.log_dir.glob('*.log*'):
-            try:
-                if log_file.stat().st_mtime < cutoff_time:
-                    log_file.unlink()
-                    print(f"Removed old log file: {log_file}")
-            except Exception as e:
-                print(f"Error removing log file {log_file}: {e}")
+        # DirEntry caches the file type from the directory listing, so only
+        # log files cost a stat call
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                if '.log' not in entry.name:
+                    continue
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        logger.info(f"Removed old log file: {entry.path}")
+                except Exception as e:
+                    logger.warning(f"Error removing log file {entry.path}: {e}")
 
 
 # Global logger instance
 _logger_instance: Optional[ProbeBasicLogger] = None
 
-def initialize_logging(log_dir: Optional[Path] = None, log_level: str = 'INFO') -> ProbeBasicLogger:
+def initialize_logging(log_dir: Optional[Path] = None, log_level: str = 'INFO',
+                       use_caller_info: bool = True) -> ProbeBasicLogger:
     """
     Initialize the global logging system
     
     Args:
         log_dir: Directory for log files
         log_level: Default logging level
+        use_caller_info: Record the calling function in subsystem log files
         
     Returns:
         ProbeBasicLogger instance
@@ -186,7 +542,7 @@ def initialize_logging(log_dir: Optional[Path] = None, log_level: str = 'INFO')
     global _logger_instance
     
     if _logger_instance is None:
-        _logger_instance = ProbeBasicLogger(log_dir, log_level)
+        _logger_instance = ProbeBasicLogger(log_dir, log_level, use_caller_info)
     
     return _logger_instance
 
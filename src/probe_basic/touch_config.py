@@ -7,6 +7,9 @@ touch-optimized interface, including accessibility guidelines,
 responsive design breakpoints, and touch interaction parameters.
 """
 
+import bisect
+from types import MappingProxyType
+
 # Touch Target Sizes (following WCAG 2.1 AA guidelines)
 TOUCH_TARGET_MINIMUM = 44  # pixels - minimum touch target size
 TOUCH_TARGET_PREFERRED = 48  # pixels - preferred touch target size for better UX
@@ -176,6 +179,35 @@ TOUCH_OPTIMIZATIONS = {
     'enable_voice_commands': False,    # Voice command integration
 }
 
+# Size class lookup table for get_size_class_for_screen
+_BP_WIDTHS = (BREAKPOINTS['small'], BREAKPOINTS['medium'], BREAKPOINTS['large'])
+_BP_NAMES = ('compact', 'normal', 'large', 'extra_large')
+
+# Spacing multipliers per size class
+_SPACING_MULTIPLIERS = {
+    'compact': 0.75,
+    'normal': 1.0,
+    'large': 1.25,
+    'extra_large': 1.5
+}
+
+# Responsive spacing and font size tables, precomputed per size class
+_RESPONSIVE_SPACING = {
+    size_class: MappingProxyType({
+        key: int(value * multiplier)
+        for key, value in TOUCH_SPACING.items()
+    })
+    for size_class, multiplier in _SPACING_MULTIPLIERS.items()
+}
+
+_RESPONSIVE_FONT_SIZES = {
+    size_class: MappingProxyType({
+        key: int(value * config['font_scale'])
+        for key, value in FONT_SIZES.items()
+    })
+    for size_class, config in SIZE_CLASSES.items()
+}
+
 def get_size_class_for_screen(width, height):
     """
     Determine appropriate size class based on screen dimensions
@@ -187,14 +219,7 @@ def get_size_class_for_screen(width, height):
     Returns:
         str: Size class ('compact', 'normal', 'large', 'extra_large')
     """
-    if width < BREAKPOINTS['small']:
-        return 'compact'
-    elif width < BREAKPOINTS['medium']:
-        return 'normal'
-    elif width < BREAKPOINTS['large']:
-        return 'large'
-    else:
-        return 'extra_large'
+    return _BP_NAMES[bisect.bisect_right(_BP_WIDTHS, width)]
 
 def get_responsive_spacing(size_class):
     """
@@ -204,21 +229,9 @@ def get_responsive_spacing(size_class):
         size_class: Size class string
     
     Returns:
-        dict: Spacing configuration
+        Mapping: Read-only spacing configuration
     """
-    spacing_multipliers = {
-        'compact': 0.75,
-        'normal': 1.0,
-        'large': 1.25,
-        'extra_large': 1.5
-    }
-    
-    multiplier = spacing_multipliers.get(size_class, 1.0)
-    
-    return {
-        key: int(value * multiplier)
-        for key, value in TOUCH_SPACING.items()
-    }
+    return _RESPONSIVE_SPACING.get(size_class, _RESPONSIVE_SPACING['normal'])
 
 def get_responsive_font_sizes(size_class):
     """
@@ -228,14 +241,9 @@ def get_responsive_font_sizes(size_class):
         size_class: Size class string
     
     Returns:
-        dict: Font size configuration
+        Mapping: Read-only font size configuration
     """
-    scale = SIZE_CLASSES.get(size_class, SIZE_CLASSES['normal'])['font_scale']
-    
-    return {
-        key: int(value * scale)
-        for key, value in FONT_SIZES.items()
-    }
+    return _RESPONSIVE_FONT_SIZES.get(size_class, _RESPONSIVE_FONT_SIZES['normal'])
 
 # Default configuration that can be imported and modified
 DEFAULT_CONFIG = {
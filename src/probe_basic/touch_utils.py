@@ -6,8 +6,13 @@ This module provides utilities for managing themes, responsive design,
 and touch interface adaptations in the PB-Touch system.
 """
 
+import atexit
+import json
 import os
-from qtpy.QtCore import QObject, Signal, QSettings, QSize
+import re
+import tempfile
+from pathlib import Path
+from qtpy.QtCore import Qt, QObject, Signal, QSettings, QSize, QTimer
 from qtpy.QtWidgets import QApplication
 from qtpy.QtGui import QScreen
 
@@ -17,6 +22,100 @@ from .touch_config import (
     get_responsive_spacing, get_responsive_font_sizes
 )
 
+# Delay before reacting to screen add/remove/geometry signals (ms)
+SCREEN_UPDATE_DEBOUNCE_MS = 150
+
+# Theme and size class preferences, relative to the home directory
+THEME_SETTINGS_FILE = os.path.join('.probe_basic', 'touch_theme.json')
+
+
+def _load_theme_settings(path):
+    """
+    Load persisted theme preferences
+    
+    Preferences saved by earlier versions through QSettings are picked up
+    when the JSON file does not exist yet.
+    
+    Args:
+        path: Path of the JSON settings file
+        
+    Returns:
+        dict: Stored preferences, empty if none were saved
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+        if isinstance(settings, dict):
+            return settings
+    except FileNotFoundError:
+        legacy = QSettings('ProbeBasic', 'TouchTheme')
+        return {
+            key: legacy.value(key)
+            for key in ('theme', 'size_class')
+            if legacy.contains(key)
+        }
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not load theme settings: {path}: {e}")
+    return {}
+
+
+# Preferences shared by every TouchThemeManager, loaded by the first one
+# and written once at exit
+_theme_settings_path = None
+_theme_settings = None
+_saved_theme_settings = {}
+
+
+def _shared_theme_settings():
+    """
+    Get the theme preferences shared by all TouchThemeManager instances
+    
+    Returns:
+        dict: Current preferences, loaded from disk on first use
+    """
+    global _theme_settings_path, _theme_settings
+    if _theme_settings is None:
+        _theme_settings_path = Path.home() / THEME_SETTINGS_FILE
+        _theme_settings = _load_theme_settings(_theme_settings_path)
+        _saved_theme_settings.update(_theme_settings)
+    return _theme_settings
+
+
+def _save_theme_settings():
+    """
+    Write the shared theme preferences if they changed since they were loaded
+    
+    The JSON is written to a temporary sibling and renamed over the
+    settings file, so an interrupted write never truncates it.
+    """
+    if _theme_settings is None or _theme_settings == _saved_theme_settings:
+        return
+    
+    path = _theme_settings_path
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".",
+                                        suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(_theme_settings, f)
+            os.replace(tmp_file, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
+    except OSError as e:
+        print(f"Warning: Could not save theme settings: {path}: {e}")
+        return
+    
+    _saved_theme_settings.clear()
+    _saved_theme_settings.update(_theme_settings)
+
+
+atexit.register(_save_theme_settings)
+
 
 class TouchThemeManager(QObject):
     """
@@ -27,14 +126,38 @@ class TouchThemeManager(QObject):
     theme_changed = Signal(str)  # theme_name
     size_class_changed = Signal(str)  # size_class
     
+    # Responsive placeholder, e.g. var(button_height)
+    _VAR_RE = re.compile(r'var\((\w+)\)')
+    
     def __init__(self, vcp_dir=None):
         super().__init__()
         self.vcp_dir = vcp_dir or os.path.dirname(__file__)
-        self.settings = QSettings('ProbeBasic', 'TouchTheme')
-        self.current_theme = self.settings.value('theme', 'default')
-        self.current_size_class = self.settings.value('size_class', 'normal')
+        
+        # Preferences live in memory and are written once at exit, keeping
+        # disk I/O out of set_theme/set_size_class
+        self._settings = _shared_theme_settings()
+        
+        self.current_theme = self._settings.get('theme', 'default')
+        self.current_size_class = self._settings.get('size_class', 'normal')
         self._screen_monitor = None
         
+        # Primary screen and its last reported geometry, kept up to date by
+        # the screen signals instead of being re-queried on every update
+        self._primary_screen = None
+        self._screen_geometry = None
+        
+        # Raw stylesheets keyed by theme file, and responsive-adjusted
+        # stylesheets keyed by (theme file, size class)
+        self._stylesheet_cache = {}
+        self._adjusted_stylesheet_cache = {}
+        
+        # Screen signals fire continuously while geometry is changing, so
+        # only re-evaluate the size class once they settle
+        self._screen_update_timer = QTimer(self)
+        self._screen_update_timer.setSingleShot(True)
+        self._screen_update_timer.setInterval(SCREEN_UPDATE_DEBOUNCE_MS)
+        self._screen_update_timer.timeout.connect(self._update_size_class_from_screen)
+        
         # Monitor screen changes
         if QApplication.instance():
             self._setup_screen_monitoring()
@@ -45,30 +168,49 @@ class TouchThemeManager(QObject):
         if app:
             app.screenAdded.connect(self._on_screen_changed)
             app.screenRemoved.connect(self._on_screen_changed)
-            primary_screen = app.primaryScreen()
-            if primary_screen:
+            app.primaryScreenChanged.connect(self._on_screen_changed)
+            self._refresh_primary_screen()
+    
+    def _refresh_primary_screen(self):
+        """Re-query the primary screen and follow its geometry changes"""
+        app = QApplication.instance()
+        primary_screen = app.primaryScreen() if app else None
+        
+        if primary_screen is not self._primary_screen:
+            if self._primary_screen is not None:
+                try:
+                    self._primary_screen.geometryChanged.disconnect(self._on_screen_geometry_changed)
+                except (RuntimeError, TypeError):
+                    pass
+            if primary_screen is not None:
                 primary_screen.geometryChanged.connect(self._on_screen_geometry_changed)
+            self._primary_screen = primary_screen
+        
+        self._screen_geometry = None
+        return primary_screen
     
     def _on_screen_changed(self, screen):
         """Handle screen addition/removal"""
-        self._update_size_class_from_screen()
+        self._refresh_primary_screen()
+        self._screen_update_timer.start()
     
     def _on_screen_geometry_changed(self, geometry):
         """Handle screen geometry changes"""
-        self._update_size_class_from_screen()
+        self._screen_geometry = geometry
+        self._screen_update_timer.start()
     
     def _update_size_class_from_screen(self):
         """Update size class based on current screen geometry"""
-        app = QApplication.instance()
-        if not app:
-            return
-            
-        primary_screen = app.primaryScreen()
-        if primary_screen:
-            geometry = primary_screen.geometry()
-            new_size_class = get_size_class_for_screen(geometry.width(), geometry.height())
-            if new_size_class != self.current_size_class:
-                self.set_size_class(new_size_class)
+        geometry = self._screen_geometry
+        if geometry is None:
+            primary_screen = self._primary_screen or self._refresh_primary_screen()
+            if not primary_screen:
+                return
+            geometry = self._screen_geometry = primary_screen.geometry()
+        
+        new_size_class = get_size_class_for_screen(geometry.width(), geometry.height())
+        if new_size_class != self.current_size_class:
+            self.set_size_class(new_size_class)
     
     def get_available_themes(self):
         """Get list of available themes"""
@@ -101,7 +243,7 @@ class TouchThemeManager(QObject):
         
         old_theme = self.current_theme
         self.current_theme = theme_name
-        self.settings.setValue('theme', theme_name)
+        self._settings['theme'] = theme_name
         
         if old_theme != theme_name:
             self.theme_changed.emit(theme_name)
@@ -123,7 +265,7 @@ class TouchThemeManager(QObject):
         
         old_size_class = self.current_size_class
         self.current_size_class = size_class
-        self.settings.setValue('size_class', size_class)
+        self._settings['size_class'] = size_class
         
         if old_size_class != size_class:
             self.size_class_changed.emit(size_class)
@@ -164,12 +306,24 @@ class TouchThemeManager(QObject):
         """
         theme_file = self.get_theme_file_path(theme_name)
         
+        stylesheet = self._stylesheet_cache.get(theme_file)
+        if stylesheet is not None:
+            return stylesheet
+        
         try:
             with open(theme_file, 'r', encoding='utf-8') as f:
-                return f.read()
+                stylesheet = f.read()
         except (FileNotFoundError, IOError):
             print(f"Warning: Could not load theme file: {theme_file}")
             return ""
+        
+        self._stylesheet_cache[theme_file] = stylesheet
+        return stylesheet
+    
+    def clear_stylesheet_cache(self):
+        """Drop cached stylesheets so theme files are re-read on next apply"""
+        self._stylesheet_cache.clear()
+        self._adjusted_stylesheet_cache.clear()
     
     def apply_theme(self, app=None, theme_name=None):
         """
@@ -188,14 +342,26 @@ class TouchThemeManager(QObject):
         if not app:
             return False
         
-        stylesheet = self.load_theme_stylesheet(theme_name)
-        if stylesheet:
+        cache_key = (self.get_theme_file_path(theme_name), self.current_size_class)
+        stylesheet = self._adjusted_stylesheet_cache.get(cache_key)
+        
+        if stylesheet is None:
+            stylesheet = self.load_theme_stylesheet(theme_name)
+            if not stylesheet:
+                return False
+            
             # Apply responsive adjustments based on current size class
             stylesheet = self._apply_responsive_adjustments(stylesheet)
-            app.setStyleSheet(stylesheet)
-            return True
+            self._adjusted_stylesheet_cache[cache_key] = stylesheet
+        
+        # Keep the help button rules HelpManager appended to the old sheet,
+        # so the switch costs one repolish instead of two
+        if '#helpBtn' in app.styleSheet():
+            from .help_system import help_button_style
+            stylesheet += help_button_style()
         
-        return False
+        app.setStyleSheet(stylesheet)
+        return True
     
     def _apply_responsive_adjustments(self, stylesheet):
         """
@@ -225,12 +391,15 @@ class TouchThemeManager(QObject):
             'font_large': font_sizes['large'],
         }
         
-        # Replace placeholder variables in stylesheet
-        for var_name, value in responsive_vars.items():
-            placeholder = f"var({var_name})"
-            stylesheet = stylesheet.replace(placeholder, f"{value}px")
+        # Replace placeholder variables in a single pass, leaving unknown
+        # variables untouched
+        def substitute(match):
+            value = responsive_vars.get(match.group(1))
+            if value is None:
+                return match.group(0)
+            return f"{value}px"
         
-        return stylesheet
+        return self._VAR_RE.sub(substitute, stylesheet)
     
     def get_current_screen_info(self):
         """
@@ -239,15 +408,14 @@ class TouchThemeManager(QObject):
         Returns:
             dict: Screen information including size, DPI, etc.
         """
-        app = QApplication.instance()
-        if not app:
-            return {}
-        
-        primary_screen = app.primaryScreen()
+        primary_screen = self._primary_screen or self._refresh_primary_screen()
         if not primary_screen:
             return {}
         
-        geometry = primary_screen.geometry()
+        geometry = self._screen_geometry
+        if geometry is None:
+            geometry = self._screen_geometry = primary_screen.geometry()
+        
         return {
             'width': geometry.width(),
             'height': geometry.height(),
@@ -321,8 +489,9 @@ class TouchStyleHelper:
         widget.setProperty('touchOptimized', True)
         widget.setProperty('sizeClass', size_class)
         
-        # Force style refresh
-        if hasattr(widget, 'style'):
+        # Force style refresh; a widget that has not been polished yet picks
+        # up the new properties when it is first shown, so skip it
+        if hasattr(widget, 'style') and widget.testAttribute(Qt.WA_WState_Polished):
             style = widget.style()
             if style:
                 style.unpolish(widget)
@@ -51,6 +51,7 @@ class JobManagerWidget(QWidget):
     
     # Signals
     job_execute_requested = pyqtSignal(str)  # file_path
+    queue_populated = pyqtSignal()  # emitted after add_job_files
     
     def __init__(self, parent=None):
         super(JobManagerWidget, self).__init__(parent)
@@ -215,6 +216,7 @@ class JobManagerWidget(QWidget):
         
         # Queue signals
         self.job_queue.job_added.connect(self.on_job_added)
+        self.job_queue.jobs_added.connect(self.on_jobs_added)
         self.job_queue.job_removed.connect(self.on_job_removed)
         self.job_queue.job_status_changed.connect(self.on_job_status_changed)
         self.job_queue.queue_started.connect(self.on_queue_started)
@@ -331,6 +333,19 @@ class JobManagerWidget(QWidget):
         if os.path.exists(file_path):
             self.job_queue.add_job(file_path)
             
+    def add_job_files(self, file_paths):
+        """Add several files to the job queue with one display refresh"""
+        file_paths = [path for path in file_paths if os.path.exists(path)]
+        if file_paths:
+            # Suppress repaints while the list is rebuilt
+            self.queue_list.setUpdatesEnabled(False)
+            try:
+                self.job_queue.add_jobs(file_paths)
+            finally:
+                self.queue_list.setUpdatesEnabled(True)
+                
+        self.queue_populated.emit()
+            
     def clear_completed_jobs(self):
         """Clear completed jobs from queue"""
         self.job_queue.clear_completed()
@@ -455,6 +470,10 @@ class JobManagerWidget(QWidget):
         """Handle job added to queue"""
         self.refresh_display()
         
+    def on_jobs_added(self, jobs):
+        """Handle a batch of jobs added to queue"""
+        self.refresh_display()
+        
     def on_job_removed(self, index: int):
         """Handle job removed from queue"""
         self.refresh_display()
@@ -99,6 +99,7 @@ class JobQueue(QObject):
     
     # Signals
     job_added = pyqtSignal(JobItem)
+    jobs_added = pyqtSignal(list)  # [JobItem, ...] from a batch add
     job_removed = pyqtSignal(int)  # index
     job_moved = pyqtSignal(int, int)  # from_index, to_index
     job_status_changed = pyqtSignal(int, JobStatus)  # index, status
@@ -126,6 +127,15 @@ class JobQueue(QObject):
         self.save_queue()
         return job
         
+    def add_jobs(self, file_paths: List[str]) -> List[JobItem]:
+        """Add several jobs with a single notification and save"""
+        jobs = [JobItem(file_path) for file_path in file_paths]
+        if jobs:
+            self.jobs.extend(jobs)
+            self.jobs_added.emit(jobs)
+            self.save_queue()
+        return jobs
+        
     def remove_job(self, index: int) -> bool:
         """Remove a job from the queue"""
         if 0 <= index < len(self.jobs):
@@ -517,11 +517,32 @@ class NetworkManager(QWidget):
     def save_shares(self):
         """Save shares configuration"""
         try:
-            with open(self.shares_file, 'w') as f:
-                json.dump(self.shares, f, indent=2)
+            self.write_shares(self.shares)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save shares config:\n{e}")
             
+    def write_shares(self, shares: Dict):
+        """Write a shares mapping to shares.json, raising on failure
+        
+        The file is written to a temporary sibling and renamed over
+        shares.json, so a failed write never leaves a truncated config
+        behind. Each write uses its own temporary file, and no widgets are
+        touched, so this may run on a worker thread alongside save_shares().
+        """
+        fd, tmp_file = tempfile.mkstemp(dir=self.shares_file.parent,
+                                        prefix=self.shares_file.name + ".",
+                                        suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(shares, f, indent=2)
+            os.replace(tmp_file, self.shares_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
+        
     def load_shares_list(self):
         """Load shares into list widget"""
         self.shares_list.clear()
@@ -351,8 +351,8 @@ class ProfileManager(QWidget):
                 QMessageBox.critical(self, "Error", 
                                    f"Failed to create profile:\n{e}")
                 
-    def create_profile_bundle(self, data: Dict):
-        """Create profile bundle from template"""
+    def create_profile_bundle(self, data: Dict) -> Path:
+        """Create profile bundle from template, returning its directory"""
         profile_name = data['name']
         profile_path = self.profiles_dir / profile_name
         
@@ -394,6 +394,8 @@ class ProfileManager(QWidget):
         with open(metadata_file, 'w') as f:
             json.dump(metadata, f, indent=2)
             
+        return profile_path
+            
     def create_minimal_profile(self, profile_path: Path):
         """Create minimal profile structure"""
         # Create basic INI file
@@ -145,6 +145,76 @@ def test_comprehensive_logging():
         print("✅ Invalid log level handled gracefully")
     except Exception as e:
         print(f"❌ Error handling failed: {e}")
+
+    # Test 9: Buffered writes
+    print("\n9. Testing buffered writes...")
+    import logging
+    import queue
+    from logging_config import BufferedRotatingFileHandler, BatchingQueueListener
+
+    buffered_log = temp_log_dir / 'buffered_test.log'
+    if buffered_log.exists():
+        buffered_log.unlink()
+    buffered_handler = BufferedRotatingFileHandler(buffered_log, maxBytes=5 * 1024 * 1024)
+    listener = BatchingQueueListener(queue.Queue(), buffered_handler)
+
+    for i in range(100):
+        listener.handle(logging.LogRecord(
+            'probe_basic.buffered_test', logging.INFO, __file__, 0,
+            'Buffered record %d', (i,), None
+        ))
+
+    size_before_flush = buffered_log.stat().st_size
+    listener.flush_handlers()
+    size_after_flush = buffered_log.stat().st_size
+    buffered_handler.close()
+
+    if size_before_flush == 0 and size_after_flush > 0:
+        print("✅ Records stay buffered until the listener flushes")
+    else:
+        print(f"❌ {size_before_flush} bytes reached disk before flush, "
+              f"{size_after_flush} after")
+        return False
+
+    # Test 10: Caller information
+    print("\n10. Testing caller information...")
+    from logging_config import _set_caller_lookup
+    
+    class RecordCollector(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.records = []
+        
+        def emit(self, record):
+            self.records.append(record)
+    
+    collector = RecordCollector()
+    caller_logger = get_logger('caller_test')
+    caller_logger.addHandler(collector)
+    
+    def log_from_here(**kwargs):
+        caller_logger.error("Caller record", **kwargs)
+        return sys._getframe().f_lineno - 1
+    
+    expected_line = log_from_here()
+    _set_caller_lookup(caller_logger, False)
+    log_from_here()
+    stack_line = log_from_here(stack_info=True)
+    _set_caller_lookup(caller_logger, True)
+    caller_logger.removeHandler(collector)
+    
+    enabled, disabled, with_stack = collector.records
+    if (enabled.funcName, enabled.lineno) != ('log_from_here', expected_line):
+        print(f"❌ Caller reported as {enabled.funcName}:{enabled.lineno}, "
+              f"expected log_from_here:{expected_line}")
+        return False
+    if disabled.lineno != 0:
+        print(f"❌ Caller lookup ran while disabled ({disabled.funcName}:{disabled.lineno})")
+        return False
+    if (with_stack.funcName, with_stack.lineno) != ('log_from_here', stack_line):
+        print(f"❌ stack_info caller reported as {with_stack.funcName}:{with_stack.lineno}")
+        return False
+    print("✅ Records carry the calling function and line")
     
     print("\n" + "=" * 40)
     print("✅ All logging system tests completed successfully!")
@@ -75,13 +75,19 @@ def test_job_manager():
             
             assert len(queue.jobs) == 2, "Job queue add failed"
             
+            # Test batch add
+            batch = queue.add_jobs(["/test/file3.ngc", "/test/file4.ngc"])
+            assert len(batch) == 2, "Job queue batch add failed"
+            assert queue.jobs[-1].name == "file4.ngc", "Job queue batch order failed"
+            assert queue.add_jobs([]) == [], "Job queue empty batch add failed"
+            
             # Test queue status
             status = queue.get_queue_status()
-            assert status['pending'] == 2, "Queue status failed"
+            assert status['pending'] == 4, "Queue status failed"
             
             # Test job removal
             queue.remove_job(0)
-            assert len(queue.jobs) == 1, "Job queue remove failed"
+            assert len(queue.jobs) == 3, "Job queue remove failed"
             
             # Clean up
             os.unlink(temp_file.name)